@@ -0,0 +1,414 @@
+"""
+Code Nexus - Data Processor Benchmarks.
+Measures the throughput of the processors defined in stream_processor.
+
+Running the script without arguments executes the full suite over synthetic
+numeric, text and log payloads of 1e3 to 1e7 items and prints one JSON
+report with items/sec, peak memory and p50 latency per case, plus p99 when
+enough calls were timed. A stored baseline can be compared against to catch
+throughput, latency and memory regressions:
+
+    python benchmark.py --sizes 1000 100000 --save-baseline base.json
+    python benchmark.py --sizes 1000 100000 --baseline base.json
+"""
+
+import argparse
+import io
+import json
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+from typing import Any, Callable, Dict, List, Optional
+
+from stream_processor import (AllProcessor, NumericProcessor, TextProcessor,
+                              LogProcessor)
+
+WORDS = ["nexus", "stream", "data", "processor", "alpha", "omega", "log"]
+LEVELS = ["DEBUG", "INFO", "INFO", "INFO", "WARN", "ERROR", "CRITICAL"]
+SIZES = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]
+MIN_P99_RUNS = 100
+METRICS = [("items_per_sec", 1), ("p50_ms", -1), ("p99_ms", -1),
+           ("peak_bytes", -1)]
+
+
+def make_numbers(count: int, seed: int = 42) -> array:
+    """Generate count synthetic float readings as array('d')."""
+    rng = random.Random(seed)
+    return array("d", (rng.uniform(-100, 100) for _ in range(count)))
+
+
+def make_words(count: int, seed: int = 42) -> str:
+    """Generate a synthetic text payload of count words."""
+    rng = random.Random(seed)
+    parts = []
+    for word in rng.choices(WORDS, k=count):
+        sep = "\n" if rng.random() < 0.1 else " "
+        parts.append(word + sep)
+    return "".join(parts)
+
+
+def make_text(size: int, seed: int = 42) -> str:
+    """Generate a synthetic text payload of roughly size characters."""
+    rng = random.Random(seed)
+    parts = []
+    length = 0
+    while length < size:
+        word = rng.choice(WORDS)
+        sep = "\n" if rng.random() < 0.1 else " "
+        parts.append(word + sep)
+        length += len(word) + 1
+    return "".join(parts)
+
+
+def make_log_lines(count: int, seed: int = 42) -> List[str]:
+    """Generate count synthetic log lines with timestamps and prefixes."""
+    rng = random.Random(seed)
+    lines = []
+    for i in range(count):
+        template = "2026-01-{:02d}T{:02d}:{:02d}:{:02d}Z worker-{} {}: {} {}\n"
+        lines.append(template.format(
+            i % 28 + 1, i % 24, i % 60, i % 60, rng.randrange(8),
+            rng.choice(LEVELS), rng.choice(WORDS), rng.choice(WORDS)))
+    return lines
+
+
+def make_logs(count: int, seed: int = 42) -> str:
+    """Generate count synthetic log lines as one text blob."""
+    return "".join(make_log_lines(count, seed))
+
+
+def make_payloads(count: int, seed: int = 42) -> List[tuple]:
+    """Generate count mixed processor/data pairs."""
+    rng = random.Random(seed)
+    numeric = NumericProcessor()
+    text = TextProcessor()
+    log = LogProcessor()
+    pairs: List[tuple] = []
+    for i in range(count):
+        kind = i % 3
+        if kind == 0:
+            pairs.append((numeric, [rng.random() for _ in range(8)]))
+        elif kind == 1:
+            pairs.append((text, " ".join(rng.choices(WORDS, k=8))))
+        else:
+            template = "{}: {} {}"
+            pairs.append((log, template.format(
+                rng.choice(LEVELS), rng.choice(WORDS), rng.choice(WORDS))))
+    return pairs
+
+
+class BaselineNumeric():
+    """Original string-first numeric processor, kept as a reference."""
+
+    def __init__(self) -> None:
+        """Initialize numeric counters."""
+        self.processed = 0
+        self.sum: float = 0
+        self.avg: float = 0
+
+    def process(self, data: Any) -> str:
+        """Calculate sum and average and render every value."""
+        self.processed = len(data)
+        self.sum = sum(data)
+        self.avg = self.sum / self.processed
+        return f"Processing data: [{', '.join(str(n) for n in data)}]"
+
+    def format_output(self, result: str) -> str:
+        """Format numeric results with count, sum, and average."""
+        template = "Output: Processed {} numeric values, sum={}, avg={}"
+        return template.format(self.processed, self.sum, self.avg)
+
+    def final_output(self, index: int) -> str:
+        """Provide a indexed summary of numeric processing."""
+        template = "Result {}: Processed {} numeric values, sum={}, avg={}"
+        return template.format(index, self.processed, self.sum, self.avg)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return a fresh dictionary of numeric statistics."""
+        return {"type": "Numeric", "subtype": "data", "sum": self.sum,
+                "avg": self.avg, "processed": self.processed}
+
+
+class BaselineText():
+    """Original string-first text processor, kept as a reference."""
+
+    def __init__(self) -> None:
+        """Initialize text metrics."""
+        self.chars = 0
+        self.words = 0
+
+    def process(self, data: Any) -> str:
+        """Count characters and words and echo the text."""
+        self.chars = len(data)
+        self.words = len(data.split())
+        return f'Processing data: "{data}"'
+
+    def format_output(self, result: str) -> str:
+        """Format text results with character and word counts."""
+        template = "{} Processed text {} characters, {} words"
+        return template.format(result, self.chars, self.words)
+
+    def final_output(self, index: int) -> str:
+        """Provide a indexed summary of text processing."""
+        template = "Result {}: Processed text {} characters, {} words"
+        return template.format(index, self.chars, self.words)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return a fresh dictionary of text statistics."""
+        return {"type": "Text", "subtype": "data", "chars": self.chars,
+                "words": self.words}
+
+
+class BaselineLog():
+    """Original string-first log processor, kept as a reference."""
+
+    def __init__(self) -> None:
+        """Initialize log message and level placeholders."""
+        self.text = "..."
+        self.msg = "..."
+
+    def process(self, data: Any) -> str:
+        """Split the level from the message and echo the entry."""
+        level, _, msg = data.partition(":")
+        self.text = "ALERT" if level == "ERROR" else "INFO"
+        self.msg = msg.strip()
+        return f'Processing data: "{data}"'
+
+    def format_output(self, result: str) -> str:
+        """Format log results with alert level and message."""
+        level = "ERROR" if self.text == "ALERT" else "INFO"
+        template = "{} [{}] {} level detected: {}"
+        return template.format(result, self.text, level, self.msg)
+
+    def final_output(self, index: int) -> str:
+        """Provide a indexed summary of log processing."""
+        level = "ERROR" if self.text == "ALERT" else "INFO"
+        template = "Result {}: [{}] {} level detected: {}"
+        return template.format(index, self.text, level, self.msg)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return a fresh dictionary of log statistics."""
+        return {"type": "Log", "subtype": "entry", "msg": self.msg,
+                "error": self.text}
+
+
+def timed(func: Callable[[], Any]) -> float:
+    """Run func once and return the elapsed wall time in seconds."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def measure(func: Callable[[], Any]) -> Dict[str, float]:
+    """Return elapsed seconds and peak traced memory of one call."""
+    tracemalloc.start()
+    try:
+        elapsed = timed(func)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {"seconds": elapsed, "peak_bytes": peak}
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Return the nearest-rank percentile of samples."""
+    ordered = sorted(samples)
+    rank = -(-len(ordered) * pct // 100)
+    return ordered[max(0, int(rank) - 1)]
+
+
+def build_cases(size: int) -> Dict[str, Callable[[], Any]]:
+    """Generate the payloads for one size and return the callables to time."""
+    numbers = make_numbers(size)
+    number_list = numbers.tolist()
+    words = make_words(size)
+    lines = make_log_lines(size)
+    pairs = make_payloads(size)
+    numeric = NumericProcessor()
+    text = TextProcessor()
+    log = LogProcessor()
+    orchestrator = AllProcessor()
+    return {
+        "numeric.analyze": lambda: numeric.analyze(number_list),
+        "numeric.process_batch": lambda: numeric.process_batch(numbers),
+        "text.analyze": lambda: text.analyze(words),
+        "text.analyze_stream":
+            lambda: text.analyze_stream(io.StringIO(words)),
+        "log.analyze_lines": lambda: log.analyze_lines(lines),
+        "all.process_records":
+            lambda: sum(1 for _ in orchestrator.process_records(pairs))
+    }
+
+
+def run_suite(sizes: List[int], repeat: Optional[int] = None
+              ) -> Dict[str, Dict[str, float]]:
+    """
+    Time every case at every size. Latency percentiles are taken over the
+    repeated calls; the number of repeats shrinks as payloads grow unless
+    repeat is given, and p99 is only reported when at least MIN_P99_RUNS
+    calls were timed. Peak memory comes from one extra traced call.
+    """
+    results: Dict[str, Dict[str, float]] = {}
+    for size in sizes:
+        runs = repeat or max(3, min(200, 10 ** 6 // size))
+        for name, func in build_cases(size).items():
+            samples = [timed(func) for _ in range(runs)]
+            p50 = percentile(samples, 50)
+            stats = results[f"{name}@{size}"] = {
+                "items": size,
+                "runs": runs,
+                "items_per_sec": size / p50,
+                "p50_ms": p50 * 1000,
+                "peak_bytes": measure(func)["peak_bytes"]
+            }
+            if runs >= MIN_P99_RUNS:
+                stats["p99_ms"] = percentile(samples, 99) * 1000
+    return results
+
+
+def compare(current: Dict[str, Dict[str, float]],
+            baseline: Dict[str, Dict[str, float]],
+            tolerance: float) -> List[str]:
+    """
+    List the cases whose throughput dropped, or whose latency or peak
+    memory grew, by more than tolerance against the stored baseline.
+    Metrics missing from either report are not compared.
+    """
+    regressions = []
+    for name, stats in current.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        for metric, direction in METRICS:
+            if not base.get(metric) or metric not in stats:
+                continue
+            change = stats[metric] / base[metric] - 1
+            if change * direction < -tolerance:
+                template = "{}: {} {:,.3f} vs baseline {:,.3f} ({:+.1%})"
+                regressions.append(template.format(
+                    name, metric, stats[metric], base[metric], change))
+    return regressions
+
+
+def bench_text(size: int) -> Dict[str, float]:
+    """Compare in-memory and streaming TextProcessor throughput."""
+    text = make_text(size)
+    raw = text.encode()
+    proc = TextProcessor()
+
+    in_memory = timed(lambda: proc.process(text))
+    streaming = timed(lambda: proc.process_stream(io.BytesIO(raw)))
+    mb = len(raw) / (1 << 20)
+    return {
+        "size": len(raw),
+        "in_memory_mb_s": mb / in_memory,
+        "streaming_mb_s": mb / streaming
+    }
+
+
+def bench_logs(count: int) -> Dict[str, float]:
+    """Measure LogProcessor.process_file throughput in lines per second."""
+    logs = make_logs(count)
+    proc = LogProcessor()
+    elapsed = timed(lambda: proc.process_file(io.StringIO(logs)))
+    return {"lines": count, "lines_s": count / elapsed}
+
+
+def bench_records(count: int) -> Dict[str, float]:
+    """
+    Compare the original string-first processors, which render every
+    message eagerly, against collecting compact result records.
+    """
+    pairs = make_payloads(count)
+    orchestrator = AllProcessor()
+    baselines: Dict[type, Any] = {
+        NumericProcessor: BaselineNumeric(),
+        TextProcessor: BaselineText(),
+        LogProcessor: BaselineLog()
+    }
+    eager = [(baselines[type(proc)], data) for proc, data in pairs]
+
+    def strings() -> List[str]:
+        out = []
+        for i, (proc, data) in enumerate(eager, 1):
+            out.append(proc.process(data))
+            out.append(proc.format_output("Output:"))
+            out.append(proc.final_output(i))
+            proc.get_stats()
+        return out
+
+    def records() -> List[Any]:
+        return list(orchestrator.process_records(pairs))
+
+    first = measure(strings)
+    second = measure(records)
+    return {
+        "payloads": count,
+        "strings_s": first["seconds"],
+        "records_s": second["seconds"],
+        "strings_peak": first["peak_bytes"],
+        "records_peak": second["peak_bytes"]
+    }
+
+
+def compare_paths() -> None:
+    """Print the streaming, log parsing and result record comparisons."""
+    print("=== CODE NEXUS - PROCESSOR BENCHMARKS ===")
+    for size in (10 ** 5, 10 ** 6, 10 ** 7):
+        result = bench_text(size)
+        template = "Text {size} bytes: in-memory {in_memory_mb_s:.1f} MB/s, " \
+            "streaming {streaming_mb_s:.1f} MB/s"
+        print(template.format(**result))
+    for count in (10 ** 4, 10 ** 5, 10 ** 6):
+        result = bench_logs(count)
+        print("Logs {lines} lines: {lines_s:,.0f} lines/s".format(**result))
+    for count in (10 ** 4, 10 ** 5):
+        result = bench_records(count)
+        template = "Results {payloads} payloads: strings {strings_s:.3f}s " \
+            "/ {strings_peak:,} B, records {records_s:.3f}s " \
+            "/ {records_peak:,} B"
+        print(template.format(**result))
+
+
+def main() -> None:
+    """Run the benchmark suite and print the JSON report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[2])
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--repeat", type=int, default=None)
+    parser.add_argument("--output", help="also write the report here")
+    parser.add_argument("--baseline", help="compare against this report")
+    parser.add_argument("--save-baseline", help="store the report here")
+    parser.add_argument("--tolerance", type=float, default=0.1,
+                        help="allowed relative regression (default 0.1)")
+    parser.add_argument("--compare-paths", action="store_true",
+                        help="print the path comparisons instead")
+    args = parser.parse_args()
+
+    if args.compare_paths:
+        compare_paths()
+        return
+
+    report: Dict[str, Any] = {
+        "python": sys.version.split()[0],
+        "results": run_suite(args.sizes, args.repeat)
+    }
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+        report["regressions"] = compare(report["results"], baseline,
+                                        args.tolerance)
+
+    text = json.dumps(report, indent=2)
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(text)
+    print(text)
+    if report.get("regressions"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,8 +4,51 @@ Module providing base processing capabilities for numeric, text, and log data
 through a polymorphic interface.
 """
 
+import codecs
+import copy
+import math
+import mmap
+import operator
+import os
+import re
+from collections import deque
+from itertools import repeat
+from concurrent.futures import (Executor, ProcessPoolExecutor,
+                                ThreadPoolExecutor, FIRST_COMPLETED, wait)
+from array import array
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Union, List, Generator
+from typing import (Any, Dict, Union, List, Generator, Tuple, Iterator,
+                    Iterable, Optional, Callable, NamedTuple)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_NUMERIC_FORMATS = frozenset("bBhHiIlLqQnNfd")
+
+LOG_LEVELS: Dict[str, Tuple[str, str]] = {
+    "DEBUG": ("DEBUG", "TRACE"),
+    "INFO": ("INFO", "INFO"),
+    "WARN": ("WARN", "WARNING"),
+    "WARNING": ("WARN", "WARNING"),
+    "ERROR": ("ERROR", "ALERT"),
+    "CRITICAL": ("CRITICAL", "ALERT"),
+    "FATAL": ("CRITICAL", "ALERT")
+}
+
+_LOG_PATTERN = re.compile(
+    r"[\[(]?(?P<ts>\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?"
+    r"(?:Z|[+-]\d{2}:?\d{2})?)?[\])]?\s*"
+    r"(?P<prefix>.*?)\[?\b(?P<level>"
+    + "|".join(sorted(LOG_LEVELS, key=len, reverse=True))
+    + r")\b\]?\s*[:|-]?\s*(?P<msg>.*)",
+    re.DOTALL
+)
+
+_LOG_SNIFF = re.compile(
+    r"\b(?:" + "|".join(sorted(LOG_LEVELS, key=len, reverse=True)) + r")\b"
+)
 
 
 class ValidationError(Exception):
@@ -13,11 +56,297 @@ class ValidationError(Exception):
     pass
 
 
+def _numeric_buffer(data: Any) -> memoryview:
+    """Return a flat memoryview over a typed numeric buffer."""
+    view = memoryview(data)
+    fmt = view.format.lstrip("@=<>!")
+    if fmt not in _NUMERIC_FORMATS:
+        template = "Error: Unsupported numeric buffer format '{}'"
+        raise ValidationError(template.format(view.format))
+    if view.ndim != 1:
+        view = view.cast("B").cast(fmt)
+    return view
+
+
+def _is_typed_numeric(data: Any) -> bool:
+    """Tell whether data is a typed container holding only numbers."""
+    if np is not None and isinstance(data, np.ndarray):
+        return data.dtype.kind in "iuf"
+    if isinstance(data, array):
+        return data.typecode in _NUMERIC_FORMATS
+    if isinstance(data, memoryview):
+        return data.format.lstrip("@=<>!") in _NUMERIC_FORMATS
+    return False
+
+
+def _buffer_sum(data: Any) -> Tuple[int, float]:
+    """Count and sum a numeric buffer with a single C-level reduction."""
+    if np is not None:
+        arr = np.asarray(data)
+        if arr.dtype.kind not in "iuf":
+            template = "Error: Unsupported numeric dtype '{}'"
+            raise ValidationError(template.format(arr.dtype))
+        count = int(arr.size)
+        total = float(arr.sum(dtype=np.float64)) if count else 0.0
+    else:
+        view = _numeric_buffer(data)
+        count = len(view)
+        total = math.fsum(view)
+    if not count:
+        raise ValidationError("Error: Empty numeric batch")
+    return count, total
+
+
+def _buffer_stats(data: Any) -> Tuple[int, float, float, float, float,
+                                     float]:
+    """
+    Compute count, sum, mean, sum of squared deviations, min and max
+    over a numeric buffer. Deviations are taken from the mean in a second
+    C-level pass so large offsets do not cancel out the variance.
+    """
+    if np is not None:
+        arr = np.asarray(data)
+        if arr.dtype.kind not in "iuf":
+            template = "Error: Unsupported numeric dtype '{}'"
+            raise ValidationError(template.format(arr.dtype))
+        arr = arr.reshape(-1).astype(np.float64, copy=False)
+        count = int(arr.size)
+        if not count:
+            raise ValidationError("Error: Empty numeric batch")
+        total = float(arr.sum())
+        mean = total / count
+        m2 = float(arr.var()) * count
+        return count, total, mean, m2, float(arr.min()), float(arr.max())
+
+    view = _numeric_buffer(data)
+    count = len(view)
+    if not count:
+        raise ValidationError("Error: Empty numeric batch")
+    total = math.fsum(view)
+    mean = total / count
+    m2 = math.fsum(map(pow, map(operator.sub, view, repeat(mean)),
+                       repeat(2)))
+    return count, total, mean, m2, float(min(view)), float(max(view))
+
+
+def _iter_text_chunks(source: Any, chunk_size: int,
+                      encoding: str) -> Iterator[str]:
+    """
+    Yield decoded text chunks from a file object, an mmap, a bytes-like
+    object or an iterator of str/bytes chunks, holding one chunk at a time.
+    """
+    if isinstance(source, str):
+        if source:
+            yield source
+        return
+    if isinstance(source, (mmap.mmap, bytes, bytearray, memoryview)):
+        view = memoryview(source)
+        chunks: Any = (view[i:i + chunk_size]
+                       for i in range(0, len(view), chunk_size))
+    elif hasattr(source, "read"):
+        def reader() -> Iterator[Any]:
+            while True:
+                chunk = source.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+        chunks = reader()
+    else:
+        chunks = iter(source)
+
+    decoder = codecs.getincrementaldecoder(encoding)()
+    for chunk in chunks:
+        if not isinstance(chunk, str):
+            chunk = decoder.decode(chunk)
+        if chunk:
+            yield chunk
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def _parse_log_line(line: str) -> Tuple[Optional[str], str, str, str]:
+    """
+    Split a log line into timestamp, prefix, canonical level and message.
+    Lines without a known level fall back to INFO with the text after the
+    first colon as message.
+    """
+    match = _LOG_PATTERN.match(line)
+    if match is None:
+        return None, "", "INFO", line.partition(":")[2].strip()
+    ts, prefix, level, msg = match.groups()
+    return ts, prefix.strip(), LOG_LEVELS[level][0], msg.strip()
+
+
+class NumericStats():
+    """
+    Running count, sum, mean, variance, min and max for a numeric stream.
+    Chunks are folded in with Welford/Chan updates, so partial states built
+    by separate workers can be merged without a second pass over the data.
+    """
+    __slots__ = ("count", "total", "mean", "m2", "low", "high")
+
+    def __init__(self) -> None:
+        """Start from an empty state."""
+        self.count = 0
+        self.total = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.low = math.inf
+        self.high = -math.inf
+
+    def update(self, data: Any) -> "NumericStats":
+        """
+        Fold a chunk (buffer, sequence or single number) into the state.
+        An empty chunk leaves the state untouched.
+        """
+        if isinstance(data, (int, float)):
+            data = array("d", (data,))
+        elif not hasattr(data, "__len__"):
+            data = array("d", data)
+        if not len(data):
+            return self
+        try:
+            chunk = _buffer_stats(data)
+        except TypeError:
+            chunk = _buffer_stats(array("d", data))
+        return self._combine(*chunk)
+
+    def merge(self, other: "NumericStats") -> "NumericStats":
+        """Merge a partial state computed elsewhere into this one."""
+        if other.count:
+            self._combine(other.count, other.total, other.mean, other.m2,
+                          other.low, other.high)
+        return self
+
+    def _combine(self, count: int, total: float, mean: float, m2: float,
+                 low: float, high: float) -> "NumericStats":
+        """Apply Chan's parallel update for a chunk summary."""
+        merged = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / merged
+        self.m2 += m2 + delta * delta * self.count * count / merged
+        self.count = merged
+        self.total += total
+        self.low = min(self.low, low)
+        self.high = max(self.high, high)
+        return self
+
+    @property
+    def variance(self) -> float:
+        """Population variance of everything seen so far."""
+        return self.m2 / self.count if self.count else 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        """Return the running statistics as a dictionary."""
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.mean,
+            "min": self.low,
+            "max": self.high,
+            "variance": self.variance
+        }
+
+
+class NumericResult(NamedTuple):
+    """Compact numeric result; text is only rendered on demand."""
+    processed: int
+    sum: float
+    avg: float
+    data: Any = None
+
+    def render(self) -> str:
+        """Render the processing line, listing the source values if known."""
+        if self.data is None:
+            return f"Processing data: {self.processed} numeric values"
+        data = self.data
+        if isinstance(data, memoryview):
+            data = _numeric_buffer(data)
+        if hasattr(data, "tolist"):
+            data = data.tolist()
+        return f"Processing data: [{', '.join(map(str, data))}]"
+
+    def format_output(self, result: str) -> str:
+        """Format numeric results with count, sum, and average."""
+        template = "Output: Processed {} numeric values, sum={}, avg={}"
+        return template.format(self.processed, self.sum, self.avg)
+
+    def final_output(self, index: int) -> str:
+        """Provide a indexed summary of numeric processing."""
+        template = "Result {}: Processed {} numeric values, sum={}, avg={}"
+        return template.format(index, self.processed, self.sum, self.avg)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the numeric statistics as a dictionary."""
+        return {"sum": self.sum, "avg": self.avg, "processed": self.processed}
+
+
+class TextResult(NamedTuple):
+    """Compact text result; text is only rendered on demand."""
+    chars: int
+    words: int
+    lines: int
+    data: Any = None
+
+    def render(self) -> str:
+        """Render the processing line, quoting the source text if known."""
+        if self.data is None:
+            return f"Processing data: {self.chars} characters streamed"
+        return f'Processing data: "{self.data}"'
+
+    def format_output(self, result: str) -> str:
+        """Format text results with character and word counts."""
+        template = "{} Processed text {} characters, {} words"
+        return template.format(result, self.chars, self.words)
+
+    def final_output(self, index: int) -> str:
+        """Provide a indexed summary of text processing."""
+        template = "Result {}: Processed text {} characters, {} words"
+        return template.format(index, self.chars, self.words)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the text statistics as a dictionary."""
+        return {"chars": self.chars, "words": self.words, "lines": self.lines}
+
+
+class LogResult(NamedTuple):
+    """Compact log entry result; text is only rendered on demand."""
+    text: str
+    level: str
+    msg: str
+    timestamp: Optional[str] = None
+    data: Any = None
+
+    def render(self) -> str:
+        """Render the processing line, quoting the source entry if known."""
+        if self.data is None:
+            return "Processing data: log batch"
+        return f'Processing data: "{self.data}"'
+
+    def format_output(self, result: str) -> str:
+        """Format log results with alert level and message."""
+        template = "{} [{}] {} level detected: {}"
+        return template.format(result, self.text, self.level, self.msg)
+
+    def final_output(self, index: int) -> str:
+        """Provide a indexed summary of log processing."""
+        template = "Result {}: [{}] {} level detected: {}"
+        return template.format(index, self.text, self.level, self.msg)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the log entry statistics as a dictionary."""
+        return {"msg": self.msg, "error": self.text, "level": self.level}
+
+
 class DataProcessor(ABC):
     """
     Abstract base class defining the common interface for all data processors
     within the Code Nexus.
     """
+    result: Any = None
+    _stats: Optional[Dict[str, Any]] = None
+
     @abstractmethod
     def process(self, data: Any) -> str:
         """Process the input data and return a result string"""
@@ -28,6 +357,36 @@ class DataProcessor(ABC):
         """Validate if the provided data is appropriate for this processor"""
         pass
 
+    def validate_and_process(self, data: Any) -> str:
+        """Validate and process the input in one call, raising on failure."""
+        if not self.validate(data):
+            template = "Error: Validation {} data failed"
+            raise ValidationError(template.format(self.get_stats()['type']))
+        return self.process(data)
+
+    def analyze(self, data: Any) -> Any:
+        """
+        Validate and process the input without touching this instance and
+        return the result record, so one processor can serve concurrent
+        callers. Subclasses compute the record directly; this fallback
+        runs process_record() on a shallow copy.
+        """
+        return copy.copy(self).process_record(data)
+
+    def process_record(self, data: Any) -> Any:
+        """
+        Validate and process the input and return the latest result record.
+        Subclasses override this to skip rendering altogether.
+        """
+        self.validate_and_process(data)
+        return self.result
+
+    def _store(self, record: Any) -> Any:
+        """Keep the latest result record and drop the cached stats."""
+        self.result = record
+        self._stats = None
+        return record
+
     def format_output(self, result: str) -> str:
         """Format the output string for display[cite: 145]."""
         return ""
@@ -47,17 +406,69 @@ class NumericProcessor(DataProcessor):
     """
     def __init__(self) -> None:
         """Initialize numeric counters and status."""
-        self.processed = 0
-        self.avg = 0
-        self.sum = 0
+        self.running = NumericStats()
+        self._store(NumericResult(0, 0, 0))
 
     def process(self, data: Any) -> str:
         """Calculate sum and average from numeric list."""
-        self.processed = len(data)
-        self.sum = sum(data)
-        self.avg = self.sum / self.processed
-        char_data = [str(n) for n in data]
-        return f"Processing data: [{', '.join(char_data)}]"
+        return self.process_record(data).render()
+
+    def process_record(self, data: Any) -> NumericResult:
+        """Summarize the data and keep the record as the current result."""
+        return self._store(self.analyze(data))
+
+    def analyze(self, data: Any) -> NumericResult:
+        """
+        Validate and summarize the data in a single pass without rendering.
+        Typed numeric containers skip the per-element checks entirely.
+        """
+        if _is_typed_numeric(data):
+            count, total = _buffer_sum(data)
+            return NumericResult(count, total, total / count, data)
+
+        count = 0
+        total = 0
+        for n in data:
+            if not isinstance(n, (int, float)):
+                raise ValidationError("Error: Validation Numeric data failed")
+            count += 1
+            total += n
+        if not count:
+            raise ValidationError("Error: Validation Numeric data failed")
+        return NumericResult(count, total, total / count, data)
+
+    def process_batch(self, data: Any) -> Dict[str, float]:
+        """
+        Compute sum, mean, min, max and variance over an array.array,
+        memoryview or NumPy buffer without rendering any element.
+        """
+        count, total, mean, m2, low, high = _buffer_stats(data)
+        self._store(NumericResult(count, total, mean))
+        return {
+            "count": count,
+            "sum": total,
+            "mean": mean,
+            "min": low,
+            "max": high,
+            "variance": m2 / count
+        }
+
+    def process_chunk(self, data: Any) -> NumericStats:
+        """
+        Fold one chunk of a stream into the running state and expose the
+        cumulative count, sum and average as the current result.
+        """
+        self.running.update(data)
+        self._store(NumericResult(self.running.count, self.running.total,
+                                  self.running.mean))
+        return self.running
+
+    def merge(self, other: NumericStats) -> NumericStats:
+        """Combine a partial state from another worker into this stream."""
+        self.running.merge(other)
+        self._store(NumericResult(self.running.count, self.running.total,
+                                  self.running.mean))
+        return self.running
 
     def validate(self, data: Any) -> bool:
         """Check if all elements in data are integers or floats."""
@@ -69,26 +480,24 @@ class NumericProcessor(DataProcessor):
                 return False
         return True
 
+    def validate_and_process(self, data: Any) -> str:
+        """Validate, sum and render the data with a single checking pass."""
+        return self.process_record(data).render()
+
     def format_output(self, result: str) -> str:
         """Format numeric results with count, sum, and average."""
-        template = "Output: Processed {} numeric values, sum={}, avg={}"
-        return template.format(self.processed, self.sum, self.avg)
+        return self.result.format_output(result)
 
     def final_output(self, index: int) -> str:
         """Provide a indexed summary of numeric processing."""
-        template = "Result {}: Processed {} numeric values, sum={}, avg={}"
-        return template.format(index, self.processed, self.sum, self.avg)
+        return self.result.final_output(index)
 
     def get_stats(self) -> Dict[str, Union[str, int, bool]]:
         """Return a dictionary of numeric processing statistics."""
-        stats = {
-            "type": "Numeric",
-            "subtype": "data",
-            "sum": self.sum,
-            "avg": self.avg,
-            "processed": self.processed
-        }
-        return stats
+        if self._stats is None:
+            self._stats = {"type": "Numeric", "subtype": "data",
+                           **self.result.as_dict()}
+        return self._stats
 
 
 class TextProcessor(DataProcessor):
@@ -96,14 +505,59 @@ class TextProcessor(DataProcessor):
 
     def __init__(self) -> None:
         """Initialize text metrics and status."""
-        self.chars = 0
-        self.words = 0
+        self._store(TextResult(0, 0, 0))
 
     def process(self, data: Any) -> str:
         """Calculate character and word counts from text."""
-        self.chars = len(data)
-        self.words = len(data.split())
-        return f'Processing data: "{data}"'
+        return self.process_record(data).render()
+
+    def process_record(self, data: Any) -> TextResult:
+        """Count the text and keep the record as the current result."""
+        return self._store(self.analyze(data))
+
+    def analyze(self, data: Any) -> TextResult:
+        """Count characters, words and lines without rendering any text."""
+        if not isinstance(data, str):
+            raise ValidationError("Error: Validation Text data failed")
+        lines = data.count("\n")
+        if data and not data.endswith("\n"):
+            lines += 1
+        return TextResult(len(data), len(data.split()), lines, data)
+
+    def process_stream(self, source: Any, chunk_size: int = 1 << 20,
+                       encoding: str = "utf-8") -> Dict[str, int]:
+        """
+        Count characters, words and lines from a file object, an mmap or an
+        iterator of chunks and keep the totals as the current result.
+        """
+        record = self._store(self.analyze_stream(source, chunk_size,
+                                                 encoding))
+        return record.as_dict()
+
+    def analyze_stream(self, source: Any, chunk_size: int = 1 << 20,
+                       encoding: str = "utf-8") -> TextResult:
+        """
+        Count characters, words and lines from a file object, an mmap or an
+        iterator of chunks in constant memory. Words split across chunk
+        boundaries are counted once.
+        """
+        chars = 0
+        words = 0
+        lines = 0
+        in_word = False
+        last = "\n"
+        for chunk in _iter_text_chunks(source, chunk_size, encoding):
+            chars += len(chunk)
+            lines += chunk.count("\n")
+            words += len(chunk.split())
+            if in_word and not chunk[0].isspace():
+                words -= 1
+            last = chunk[-1]
+            in_word = not last.isspace()
+        if last != "\n":
+            lines += 1
+
+        return TextResult(chars, words, lines)
 
     def validate(self, data: Any) -> bool:
         """Validate if the input data is a string."""
@@ -111,68 +565,143 @@ class TextProcessor(DataProcessor):
 
     def format_output(self, result: str) -> str:
         """Format text results with character and word counts."""
-        template = "{} Processed text {} characters, {} words"
-        return template.format(result, self.chars, self.words)
+        return self.result.format_output(result)
 
     def final_output(self, index: int) -> str:
         """Provide a indexed summary of text processing."""
-        template = "Result {}: Processed text {} characters, {} words"
-        return template.format(index, self.chars, self.words)
+        return self.result.final_output(index)
 
     def get_stats(self) -> Dict[str, Union[str, int, bool]]:
         """Return a dictionary of text processing statistics."""
-        stats = {
-            "type": "Text",
-            "subtype": "data",
-            "chars": self.chars,
-            "words": self.words,
-        }
-        return stats
+        if self._stats is None:
+            self._stats = {"type": "Text", "subtype": "data",
+                           **self.result.as_dict()}
+        return self._stats
 
 
 class LogProcessor(DataProcessor):
     """Specialized processor for system log entries."""
 
     def __init__(self) -> None:
-        """Initialize log message and level placeholders."""
-        self.text = "..."
-        self.msg = "..."
+        """Initialize log message, level placeholders and level counters."""
+        self.counts: Dict[str, int] = {
+            level: 0 for level, _ in LOG_LEVELS.values()
+        }
+        self._store(LogResult("...", "...", "..."))
 
     def process(self, data: Any) -> str:
         """Identify log data for processing."""
-        if "ERROR:" in data:
-            self.text = "ALERT"
-            self.msg = data[7:].strip()
-        else:
-            self.text = "INFO"
-            self.msg = data[6:].strip()
-        return f'Processing data: "{data}"'
+        timestamp, _, level, msg = _parse_log_line(data)
+        self.counts[level] += 1
+        record = LogResult(LOG_LEVELS[level][1], level, msg, timestamp, data)
+        return self._store(record).render()
+
+    def process_record(self, data: Any) -> LogResult:
+        """Parse one log entry, count its level and keep the record."""
+        record = self.analyze(data)
+        self.counts[record.level] += 1
+        return self._store(record)
+
+    def analyze(self, data: Any) -> LogResult:
+        """Validate and parse one log entry without rendering any text."""
+        if not self.validate(data):
+            raise ValidationError("Error: Validation Log data failed")
+        timestamp, _, level, msg = _parse_log_line(data)
+        return LogResult(LOG_LEVELS[level][1], level, msg, timestamp, data)
+
+    def process_lines(self, lines: Iterable[str]) -> Dict[str, int]:
+        """
+        Parse a batch of log lines, updating the per-level counters, and
+        return the counts seen in this batch.
+        """
+        batch, last = self.analyze_lines(lines)
+        for level, count in batch.items():
+            self.counts[level] += count
+        if last is not None:
+            self._store(last)
+        return batch
+
+    def analyze_lines(self, lines: Iterable[str]
+                      ) -> Tuple[Dict[str, int], Optional[LogResult]]:
+        """
+        Parse a batch of log lines without touching this instance and
+        return the per-level counts with the record of the last entry.
+        Lines are accepted on the same terms as validate(): those without
+        a level token are skipped.
+        """
+        match = _LOG_PATTERN.match
+        batch = dict.fromkeys(self.counts, 0)
+        last = None
+        for line in lines:
+            found = match(line)
+            if found is None:
+                continue
+            batch[LOG_LEVELS[found.group("level")][0]] += 1
+            last = found
+
+        if last is None:
+            return batch, None
+        ts, _, token, msg = last.groups()
+        level, text = LOG_LEVELS[token]
+        return batch, LogResult(text, level, msg.strip(), ts)
+
+    def process_file(self, source: Any,
+                     batch_size: int = 1 << 20) -> Dict[str, int]:
+        """
+        Parse a whole log file (path or text file object) in batches of
+        roughly batch_size bytes and return the per-level counts.
+        """
+        if isinstance(source, str):
+            with open(source, encoding="utf-8", errors="replace") as file:
+                return self.process_file(file, batch_size)
+
+        total = dict.fromkeys(self.counts, 0)
+        while True:
+            lines = source.readlines(batch_size)
+            if not lines:
+                return total
+            for level, count in self.process_lines(lines).items():
+                total[level] += count
 
     def validate(self, data: Any) -> bool:
-        """Parse log level (ERROR/INFO) and extract message."""
-        return isinstance(data, str) and (":" in data)
+        """Check that data is a string carrying a known log level token."""
+        return isinstance(data, str) and _LOG_SNIFF.search(data) is not None
 
     def format_output(self, result: str) -> str:
         """Format log results with alert level and message."""
-        tmp = "ERROR" if self.text == "ALERT" else "INFO"
-        template = "{} [{}] {} level detected: {}"
-        return template.format(result, self.text, tmp, self.msg)
+        return self.result.format_output(result)
 
     def final_output(self, index: int) -> str:
         """Provide a indexed summary of log processing."""
-        tmp = "ERROR" if self.text == "ALERT" else "INFO"
-        template = "Result {}: [{}] {} level detected: {}"
-        return template.format(index, self.text, tmp, self.msg)
+        return self.result.final_output(index)
 
     def get_stats(self) -> Dict[str, Any]:
         """Return a dictionary of log entry statistics."""
-        stats = {
-            "type": "Log",
-            "subtype": "entry",
-            "msg": self.msg,
-            "error": self.text
-        }
-        return stats
+        if self._stats is None:
+            self._stats = {"type": "Log", "subtype": "entry",
+                           **self.result.as_dict(), "counts": self.counts}
+        return self._stats
+
+
+def _run_pair(index: int, proc: DataProcessor, data: Any) -> List[str]:
+    """
+    Run one processor/data pair and collect every message the sequential
+    orchestrator would yield for it, including its indexed summary. Only
+    the stateless analyze() API is used, so pairs may share a processor.
+    """
+    stats = proc.get_stats()
+    lines = [f"\nInitializing {stats['type']} Processor"]
+    try:
+        record = proc.analyze(data)
+        lines.append(record.render())
+        template = "Validation {} {} verified"
+        lines.append(template.format(stats['type'], stats['subtype']))
+        lines.append(record.format_output("Output:"))
+        lines.append(record.final_output(index))
+    except (ValidationError, TypeError, ValueError) as e:
+        lines.append(f"{e}")
+        lines.append(f"Result {index}: {e}")
+    return lines
 
 
 class AllProcessor():
@@ -183,29 +712,162 @@ class AllProcessor():
     def polymorphic_process(self, list: List[tuple]) -> Generator:
         """
         Iterate through a list of processor/data pairs and execute methods
-        through the common interface.
+        through the common interface. Each pair's result record is kept for
+        the summary, so pairs may share one processor instance. A pair
+        that failed is summarized by its error.
         """
+        results: List[Any] = []
         for proc, data in list:
             try:
                 stats = proc.get_stats()
                 yield f"\nInitializing {stats['type']} Processor"
-
-                if not proc.validate(data):
-                    template = "Error: Validation {} data failed"
-                    raise ValidationError(template.format(stats['type']))
-                yield proc.process(data)
+                yield proc.validate_and_process(data)
                 template = "Validation {} {} verified"
                 yield template.format(stats['type'], stats['subtype'])
                 yield proc.format_output("Output:")
+                results.append(proc.result)
             except (ValidationError, TypeError, ValueError) as e:
                 yield f"{e}"
+                results.append(e)
 
         print("\n=== Polymorphic Processing Demo ===")
         print("Processing multiple data types through same interface...")
 
-        for i, (proc, data) in enumerate(list, 1):
-            stats = proc.get_stats()
-            yield proc.final_output(i)
+        for i, result in enumerate(results, 1):
+            if isinstance(result, Exception):
+                yield f"Result {i}: {result}"
+            else:
+                yield result.final_output(i)
+
+    def process_records(self, pairs: Iterable[tuple]) -> Generator:
+        """
+        Yield one compact result record per processor/data pair, leaving all
+        text rendering to the consumer. Processors are only read, so pairs
+        may share instances. Invalid payloads yield the caught exception
+        instead of a record.
+        """
+        for proc, data in pairs:
+            try:
+                yield proc.analyze(data)
+            except (ValidationError, TypeError, ValueError) as e:
+                yield e
+
+    def concurrent_process(self, pairs: Iterable[tuple],
+                           max_workers: Optional[int] = None,
+                           max_in_flight: Optional[int] = None,
+                           ordered: bool = True,
+                           processes: bool = False) -> Generator:
+        """
+        Run processor/data pairs on a thread or process pool, keeping at
+        most max_in_flight tasks submitted at once. Messages are yielded
+        per pair, in input order or in completion order when ordered is
+        False. Processors are used through analyze() only, so one instance
+        can safely serve many payloads on the thread pool.
+        """
+        workers = max_workers or os.cpu_count() or 1
+        limit = max_in_flight or 2 * workers
+        pool: Executor
+        if processes:
+            pool = ProcessPoolExecutor(max_workers=workers)
+        else:
+            pool = ThreadPoolExecutor(max_workers=workers)
+
+        with pool:
+            if ordered:
+                queue: deque = deque()
+                for index, (proc, data) in enumerate(pairs, 1):
+                    queue.append(pool.submit(_run_pair, index, proc, data))
+                    if len(queue) >= limit:
+                        yield from queue.popleft().result()
+                while queue:
+                    yield from queue.popleft().result()
+                return
+
+            running: set = set()
+            for index, (proc, data) in enumerate(pairs, 1):
+                running.add(pool.submit(_run_pair, index, proc, data))
+                if len(running) >= limit:
+                    done, running = wait(running,
+                                         return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from future.result()
+            while running:
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+
+
+def _looks_like_log(data: str) -> bool:
+    """Tell whether a string looks like a log line from its first bytes."""
+    return _LOG_SNIFF.search(data, 0, 128) is not None
+
+
+class ProcessorRegistry():
+    """
+    Routes payloads to shared processor instances by payload type. The
+    route for each concrete type is resolved once through its MRO and
+    cached, so mixed feeds are dispatched with a single dictionary lookup
+    per item and no per-payload construction.
+    """
+    def __init__(self) -> None:
+        """Initialize empty routes and an empty resolution cache."""
+        self.routes: Dict[type, Callable[[Any], DataProcessor]] = {}
+        self._cache: Dict[type, Callable[[Any], DataProcessor]] = {}
+        self.unroutable = 0
+
+    def register(self, kind: type, processor: DataProcessor) -> None:
+        """Send every payload of the given type to processor."""
+        self.routes[kind] = lambda data: processor
+        self._cache.clear()
+
+    def register_sniffer(self, kind: type,
+                         chooser: Callable[[Any], DataProcessor]) -> None:
+        """Let chooser inspect payloads of this type to pick a processor."""
+        self.routes[kind] = chooser
+        self._cache.clear()
+
+    def resolve(self, data: Any) -> DataProcessor:
+        """Return the processor that should handle this payload."""
+        kind = type(data)
+        route = self._cache.get(kind)
+        if route is None:
+            for base in kind.__mro__:
+                if base in self.routes:
+                    route = self._cache[kind] = self.routes[base]
+                    break
+            else:
+                template = "Error: No processor registered for {}"
+                raise ValidationError(template.format(kind.__name__))
+        return route(data)
+
+    def route(self, payloads: Iterable[Any]) -> Generator[tuple, None, None]:
+        """
+        Pair each payload with its processor for AllProcessor. Payloads of
+        an unregistered type are skipped and counted in unroutable, so one
+        stray item does not abort the whole feed.
+        """
+        for data in payloads:
+            try:
+                proc = self.resolve(data)
+            except ValidationError:
+                self.unroutable += 1
+                continue
+            yield proc, data
+
+    @classmethod
+    def default(cls) -> "ProcessorRegistry":
+        """Build a registry for the numeric, text and log processors."""
+        registry = cls()
+        numeric = NumericProcessor()
+        text = TextProcessor()
+        log = LogProcessor()
+        for kind in (list, tuple, array, memoryview):
+            registry.register(kind, numeric)
+        if np is not None:
+            registry.register(np.ndarray, numeric)
+        registry.register_sniffer(
+            str, lambda data: log if _looks_like_log(data) else text)
+        return registry
 
 
 def main() -> None:
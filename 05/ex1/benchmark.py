@@ -0,0 +1,199 @@
+"""
+Code Nexus - Stream System Benchmarks.
+Measures the cost of the stream management features in data_stream.
+"""
+
+import os
+import random
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from data_stream import (SENSOR_FIELDS, SENSOR_FRAME, StreamProcess,
+                         ShardedStreamProcess, SensorStream, SensorHistory,
+                         TransactionStream, EventStream)
+
+EVENTS = ["login", "logout", "error", "deploy", "alert", "sync"]
+
+
+def timed(func: Callable[[], Any]) -> float:
+    """Run func once and return the elapsed wall time in seconds."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def make_batch(stream: Any, rng: random.Random, size: int) -> Any:
+    """Generate one synthetic batch of size items for stream."""
+    if isinstance(stream, SensorStream):
+        return [{"temp": rng.uniform(-10, 30),
+                 "humidity": rng.uniform(0, 100),
+                 "pressure": rng.uniform(900, 1100)} for _ in range(size)]
+    if isinstance(stream, TransactionStream):
+        return [rng.randint(-300, 300) for _ in range(size)]
+    return rng.choices(EVENTS, k=size)
+
+
+def make_streams(count: int) -> List[Any]:
+    """Create count streams of mixed types."""
+    streams: List[Any] = []
+    for i in range(count):
+        kind = i % 3
+        if kind == 0:
+            streams.append(SensorStream(f"SENSOR_{i}"))
+        elif kind == 1:
+            streams.append(TransactionStream(f"TRANS_{i}"))
+        else:
+            streams.append(EventStream(f"EVENT_{i}"))
+    return streams
+
+
+def make_registry(count: int, seed: int = 42) -> StreamProcess:
+    """Register count streams of mixed types, each with one batch."""
+    rng = random.Random(seed)
+    process = StreamProcess()
+    for stream in make_streams(count):
+        size = 1 if isinstance(stream, SensorStream) else 3
+        process.ingest(stream, make_batch(stream, rng, size), "high", False)
+    return process
+
+
+def bench_checkpoint(count: int) -> Dict[str, float]:
+    """Time a checkpoint of count streams and its restore at startup."""
+    process = make_registry(count)
+    path = os.path.join(tempfile.mkdtemp(), "streams.ckpt")
+    size = 0
+
+    def write() -> None:
+        nonlocal size
+        size = process.checkpoint(path)
+
+    checkpoint_s = timed(write)
+    restored = StreamProcess()
+    restore_s = timed(lambda: restored.restore(path))
+    os.remove(path)
+    return {
+        "streams": count,
+        "bytes": size,
+        "checkpoint_ms": checkpoint_s * 1000,
+        "restore_ms": restore_s * 1000
+    }
+
+
+def make_traffic(count: int, rounds: int, size: int,
+                 seed: int = 42) -> List[Tuple[Any, Any]]:
+    """Generate rounds batches of size items for each of count streams."""
+    rng = random.Random(seed)
+    streams = make_streams(count)
+    return [(stream, make_batch(stream, rng, size))
+            for _ in range(rounds) for stream in streams]
+
+
+def bench_sharded(count: int, rounds: int = 10,
+                  size: int = 50) -> Dict[str, float]:
+    """
+    Compare single-process ingestion with ShardedStreamProcess using one
+    worker per core, including the final merge on batch_result.
+    """
+    traffic = make_traffic(count, rounds, size)
+    workers = os.cpu_count() or 1
+
+    def ingest(process: StreamProcess) -> None:
+        for stream, batch in traffic:
+            process.ingest(stream, batch, "high", False)
+        for _ in process.batch_result():
+            pass
+
+    single_s = timed(lambda: ingest(StreamProcess()))
+    traffic = make_traffic(count, rounds, size)
+    with ShardedStreamProcess(workers) as sharded:
+        sharded_s = timed(lambda: ingest(sharded))
+    return {
+        "batches": len(traffic),
+        "workers": workers,
+        "single_s": len(traffic) / single_s,
+        "sharded_s": len(traffic) / sharded_s
+    }
+
+
+def make_frames(count: int, seed: int = 42) -> bytes:
+    """Pack count synthetic readings with the default frame layout."""
+    rng = random.Random(seed)
+    pack = SENSOR_FRAME.struct.pack
+    return b"".join(pack(rng.uniform(-10, 30), rng.uniform(0, 100),
+                         rng.uniform(900, 1100)) for _ in range(count))
+
+
+def bench_frames(count: int) -> Dict[str, float]:
+    """
+    Compare decoding binary frames into per-reading dicts before
+    process_batch against handing the buffer to process_batch directly.
+    """
+    frames = make_frames(count)
+
+    def dicts() -> None:
+        rows = SENSOR_FRAME.struct.iter_unpack(frames)
+        SensorStream("DICT").process_batch(
+            [dict(zip(SENSOR_FIELDS, row)) for row in rows])
+
+    dict_s = timed(dicts)
+    binary_s = timed(lambda: SensorStream("BIN").process_batch(frames))
+    return {
+        "frames": count,
+        "dict_fps": count / dict_s,
+        "binary_fps": count / binary_s
+    }
+
+
+def bench_history(count: int, seed: int = 42) -> Dict[str, float]:
+    """
+    Store count slowly drifting readings taken once a second with some
+    jitter, then report bytes per reading and full-range decode speed.
+    """
+    rng = random.Random(seed)
+    history = SensorHistory()
+    ts = 1_700_000_000_000
+    temp, humidity, pressure = 20.0, 50.0, 1013.0
+    for _ in range(count):
+        ts += 1000 + rng.choice((0, 0, 0, 1, -1))
+        temp += rng.choice((-0.1, 0.0, 0.0, 0.1))
+        humidity += rng.choice((-0.5, 0.0, 0.0, 0.5))
+        pressure += rng.choice((-0.25, 0.0, 0.25))
+        history.append(ts, round(temp, 1), round(humidity, 1),
+                       round(pressure, 2))
+    decode_s = timed(history.query)
+    return {
+        "readings": count,
+        "bytes_per_reading": history.nbytes / count,
+        "decode_rps": count / decode_s
+    }
+
+
+def main() -> None:
+    """Run the benchmarks and print a short report."""
+    print("=== CODE NEXUS - STREAM BENCHMARKS ===")
+    for count in (10 ** 3, 10 ** 4, 10 ** 5):
+        result = bench_checkpoint(count)
+        template = "Checkpoint {streams} streams: {bytes:,} B, " \
+            "write {checkpoint_ms:.1f} ms, restore {restore_ms:.1f} ms"
+        print(template.format(**result))
+    for count in (10 ** 3, 10 ** 4):
+        result = bench_sharded(count)
+        template = "Ingest {batches} batches: single {single_s:,.0f} " \
+            "batches/s, {workers} shards {sharded_s:,.0f} batches/s"
+        print(template.format(**result))
+    for count in (10 ** 4, 10 ** 5, 10 ** 6):
+        result = bench_frames(count)
+        template = "Frames {frames}: dicts {dict_fps:,.0f} frames/s, " \
+            "binary {binary_fps:,.0f} frames/s"
+        print(template.format(**result))
+    for count in (10 ** 4, 10 ** 5, 10 ** 6):
+        result = bench_history(count)
+        template = "History {readings} readings: " \
+            "{bytes_per_reading:.2f} B/reading, " \
+            "decode {decode_rps:,.0f} readings/s"
+        print(template.format(**result))
+
+
+if __name__ == "__main__":
+    main()
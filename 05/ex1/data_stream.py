@@ -4,22 +4,1081 @@ Module for processing different types of data streams
 (Sensor, Transaction, Event) using object-oriented principles.
 """
 
+import asyncio
+import heapq
+import math
+import multiprocessing
+import os
+import pickle
+import random
+import re
+import struct
+import sys
+import time
+import zlib
 from abc import ABC, abstractmethod
-from typing import Any, List, Dict, Union, Optional, Generator
+from array import array
+from collections import Counter, OrderedDict, deque
+from itertools import islice
+from queue import Empty
+from typing import (Any, List, Dict, Union, Optional, Generator, Iterable,
+                    Tuple, NamedTuple, Deque, AsyncIterator, Callable)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+SNAPSHOT_MAGIC = b"NXCK"
+SNAPSHOT_VERSION = 3
+
+_SNAPSHOT_HEADER = struct.Struct("<4sBI")
+_STR_LEN = struct.Struct("<H")
+_COUNT = struct.Struct("<I")
+_COUNTERS = struct.Struct("<qq")
+_SENSOR_STATE = struct.Struct("<qqddddqqq")
+_TRANS_STATE = struct.Struct("<qqqqqqqq")
+_HIST_ENTRY = struct.Struct("<q")
+_READING = struct.Struct("<ddd")
+_READING_BITS = struct.Struct("<QQQ")
+_MASK64 = (1 << 64) - 1
+_DOD_WIDTHS = (7, 9, 12)
+
+SENSOR_FIELDS = ("temp", "humidity", "pressure")
+SENSOR_THRESHOLDS: Dict[str, Tuple[float, float]] = {
+    "temp": (-20, 25),
+    "humidity": (0, 95),
+    "pressure": (0, 2500)
+}
+
+
+def _pack_str(text: str) -> bytes:
+    """Encode a string with a two-byte length prefix."""
+    raw = text.encode()
+    return _STR_LEN.pack(len(raw)) + raw
+
+
+def _unpack_str(data: Any, offset: int) -> Tuple[str, int]:
+    """Decode a length-prefixed string and return it with the new offset."""
+    (size,) = _STR_LEN.unpack_from(data, offset)
+    offset += _STR_LEN.size
+    return bytes(data[offset:offset + size]).decode(), offset + size
+
+
+def format_units(units: int, scale: int, signed: bool = True) -> str:
+    """
+    Render an amount held in integer minor units (scale per unit, a power
+    of ten) as a decimal string without going through floats. Positive
+    amounts get a leading "+" when signed is True.
+    """
+    whole, frac = divmod(abs(units), scale)
+    text = str(whole)
+    if frac:
+        digits = len(str(scale)) - 1
+        text += f".{frac:0{digits}d}".rstrip("0")
+    if units < 0:
+        return "-" + text
+    return "+" + text if signed and units else text
+
+
+_FRAME_CODES = {
+    "b": "i1", "B": "u1", "h": "i2", "H": "u2", "i": "i4", "I": "u4",
+    "l": "i4", "L": "u4", "q": "i8", "Q": "u8", "e": "f2", "f": "f4",
+    "d": "f8"
+}
+_FRAME_ITEM = re.compile(r"(\d*)([xbBhHiIlLqQefd])")
+_NATIVE_ORDER = "<" if sys.byteorder == "little" else ">"
+_END_OF_SOURCE = object()
+
+
+class SensorFrameLayout():
+    """
+    Declared layout of a packed binary sensor frame: a struct format with
+    standard sizes (starting with "<", ">", "!" or "=") and one name per
+    value it unpacks. Values named None (a sensor id, a sequence number)
+    are skipped, as are "x" pad bytes.
+    """
+
+    def __init__(self, fmt: str = "<fff",
+                 fields: Iterable[Optional[str]] = SENSOR_FIELDS) -> None:
+        """Compile the format and check that it carries every field."""
+        if not fmt or fmt[0] not in "<>!=":
+            raise ValueError("Frame format needs an explicit byte order")
+        self.struct = struct.Struct(fmt)
+        self.fields: Tuple[Optional[str], ...] = tuple(fields)
+        self.codes: List[str] = []
+        for count, code in _FRAME_ITEM.findall(fmt[1:]):
+            if code != "x":
+                self.codes.extend(code * int(count or 1))
+        if len(self.codes) != len(self.fields):
+            raise ValueError("Frame format and field names do not match")
+        missing = set(SENSOR_FIELDS) - set(self.fields)
+        if missing:
+            raise ValueError(f"Frame layout lacks {sorted(missing)}")
+        self.order = {"!": ">", "=": _NATIVE_ORDER}.get(fmt[0], fmt[0])
+        self.index = {name: self.fields.index(name) for name in SENSOR_FIELDS}
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle as format and field names; struct.Struct is rebuilt."""
+        return (SensorFrameLayout, (self.struct.format, self.fields))
+
+    def dtype(self) -> Any:
+        """Return the equivalent NumPy structured dtype."""
+        names, formats, offsets = [], [], []
+        offset = 0
+        fmt = self.order
+        for count, code in _FRAME_ITEM.findall(self.struct.format[1:]):
+            for _ in range(int(count or 1)):
+                if code != "x":
+                    name = self.fields[len(names)]
+                    names.append(name or f"_skip{len(names)}")
+                    formats.append(self.order + _FRAME_CODES[code])
+                    offsets.append(offset)
+                fmt += code
+                offset = struct.calcsize(fmt)
+        return np.dtype({"names": names, "formats": formats,
+                         "offsets": offsets, "itemsize": self.struct.size})
+
+    def uniform(self) -> Optional[str]:
+        """Return the array typecode if every value shares one float type."""
+        if len(set(self.codes)) != 1 or self.codes[0] not in "fd":
+            return None
+        code = self.codes[0]
+        if self.struct.size != len(self.codes) * array(code).itemsize:
+            return None
+        return code
+
+
+SENSOR_FRAME = SensorFrameLayout()
+
+
+class SensorBatch():
+    """
+    Columnar batch of sensor readings. Each field lives in its own
+    contiguous array('d'), so large batches need no per-reading dict.
+    """
+
+    def __init__(self, temp: Iterable[float] = (),
+                 humidity: Iterable[float] = (),
+                 pressure: Iterable[float] = ()) -> None:
+        """Build the columns, which must all have the same length."""
+        self.temp = array("d", temp)
+        self.humidity = array("d", humidity)
+        self.pressure = array("d", pressure)
+        if not len(self.temp) == len(self.humidity) == len(self.pressure):
+            raise ValueError("Sensor columns must have the same length")
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, float]]
+                     ) -> "SensorBatch":
+        """Convert a list of per-reading dicts into columns."""
+        batch = cls()
+        for item in records:
+            batch.append(item["temp"], item["humidity"], item["pressure"])
+        return batch
+
+    @classmethod
+    def from_frames(cls, frames: Any,
+                    layout: Optional[SensorFrameLayout] = None
+                    ) -> "SensorBatch":
+        """
+        Decode packed binary frames (bytes, bytearray or memoryview) in
+        bulk straight into columns, without per-reading dicts. NumPy reads
+        the buffer in place through a structured dtype; otherwise frames
+        of one float type are split with strided array slices and any
+        other layout goes through struct.iter_unpack.
+        """
+        layout = layout or SENSOR_FRAME
+        view = memoryview(frames).cast("B")
+        if len(view) % layout.struct.size:
+            raise ValueError("Frame buffer is not a whole number of frames")
+        if not len(view):
+            return cls()
+        if np is not None:
+            rows = np.frombuffer(view, dtype=layout.dtype())
+            batch = cls()
+            for name in SENSOR_FIELDS:
+                values = np.ascontiguousarray(rows[name], dtype=np.float64)
+                batch.column(name).frombytes(values.tobytes())
+            return batch
+
+        width = len(layout.fields)
+        code = layout.uniform()
+        if code is not None:
+            values = array(code)
+            values.frombytes(view)
+            if layout.order != _NATIVE_ORDER:
+                values.byteswap()
+            return cls(*(values[layout.index[name]::width]
+                         for name in SENSOR_FIELDS))
+        columns = list(zip(*layout.struct.iter_unpack(view)))
+        return cls(*(columns[layout.index[name]] for name in SENSOR_FIELDS))
+
+    def append(self, temp: float, humidity: float, pressure: float) -> None:
+        """Add one reading to the end of the batch."""
+        self.temp.append(temp)
+        self.humidity.append(humidity)
+        self.pressure.append(pressure)
+
+    def column(self, name: str) -> array:
+        """Return the contiguous column for a sensor field."""
+        return getattr(self, name)
+
+    def take(self, indices: Any) -> "SensorBatch":
+        """Return a new batch holding only the readings at indices."""
+        batch = SensorBatch()
+        for name in SENSOR_FIELDS:
+            column = self.column(name)
+            if np is not None:
+                values = np.frombuffer(column, dtype=np.float64)[indices]
+                batch.column(name).frombytes(values.tobytes())
+            else:
+                batch.column(name).extend(column[i] for i in indices)
+        return batch
+
+    def __len__(self) -> int:
+        """Return the number of readings in the batch."""
+        return len(self.temp)
+
+
+def _column_mean(column: array) -> float:
+    """Mean of a column, vectorized with NumPy when available."""
+    if not column:
+        return 0.0
+    if np is not None:
+        return float(np.frombuffer(column, dtype=np.float64).mean())
+    return math.fsum(column) / len(column)
+
+
+class WindowResult(NamedTuple):
+    """Aggregate of one closed tumbling window."""
+    start: float
+    end: float
+    count: int
+    total: float
+    low: float
+    high: float
+
+    @property
+    def mean(self) -> float:
+        """Average value inside the window."""
+        return self.total / self.count if self.count else 0.0
+
+
+class SlidingWindow():
+    """
+    Count- or time-based sliding window with O(1) amortized updates.
+    Values sit in a two-stack queue where every entry of the front stack
+    carries the sum/min/max of itself and everything behind it, so the
+    window aggregate never needs a pass over its contents.
+    """
+
+    def __init__(self, size: Optional[int] = None,
+                 span: Optional[float] = None) -> None:
+        """Keep at most size values, or the values of the last span secs."""
+        if size is None and span is None:
+            raise ValueError("A window needs a size or a span")
+        self.size = size
+        self.span = span
+        self._front: List[Tuple[float, float, float, float]] = []
+        self._back: List[Tuple[float, float]] = []
+        self._back_sum = 0.0
+        self._back_low = math.inf
+        self._back_high = -math.inf
+
+    def push(self, value: float, ts: Optional[float] = None) -> None:
+        """Add a value observed at ts and evict what left the window."""
+        ts = time.time() if ts is None else ts
+        self._back.append((ts, value))
+        self._back_sum += value
+        self._back_low = min(self._back_low, value)
+        self._back_high = max(self._back_high, value)
+        if self.size is not None:
+            while len(self) > self.size:
+                self._pop()
+        if self.span is not None:
+            while self._oldest() <= ts - self.span:
+                self._pop()
+
+    def _oldest(self) -> float:
+        """Timestamp of the oldest value still in the window."""
+        if self._front:
+            return self._front[-1][0]
+        return self._back[0][0] if self._back else math.inf
+
+    def _pop(self) -> None:
+        """Drop the oldest value, refilling the front stack if needed."""
+        if not self._front:
+            total, low, high = 0.0, math.inf, -math.inf
+            for ts, value in reversed(self._back):
+                total += value
+                low = min(low, value)
+                high = max(high, value)
+                self._front.append((ts, total, low, high))
+            self._back.clear()
+            self._back_sum = 0.0
+            self._back_low = math.inf
+            self._back_high = -math.inf
+        self._front.pop()
+
+    def __len__(self) -> int:
+        """Return the number of values inside the window."""
+        return len(self._front) + len(self._back)
+
+    @property
+    def total(self) -> float:
+        """Sum of the values inside the window."""
+        front = self._front[-1][1] if self._front else 0.0
+        return front + self._back_sum
+
+    @property
+    def mean(self) -> float:
+        """Average of the values inside the window."""
+        return self.total / len(self) if len(self) else 0.0
+
+    @property
+    def low(self) -> float:
+        """Smallest value inside the window."""
+        front = self._front[-1][2] if self._front else math.inf
+        return min(front, self._back_low)
+
+    @property
+    def high(self) -> float:
+        """Largest value inside the window."""
+        front = self._front[-1][3] if self._front else -math.inf
+        return max(front, self._back_high)
+
+
+class TumblingWindow():
+    """
+    Count- or time-based tumbling window. Only the open window's running
+    aggregate is kept; closed windows are emitted as WindowResult records
+    and the most recent ones are retained in self.closed.
+    """
+
+    def __init__(self, size: Optional[int] = None,
+                 span: Optional[float] = None, keep: int = 64) -> None:
+        """Close a window every size values or every span seconds."""
+        if size is None and span is None:
+            raise ValueError("A window needs a size or a span")
+        self.size = size
+        self.span = span
+        self.closed: Deque[WindowResult] = deque(maxlen=keep)
+        self._reset(None)
+
+    def _reset(self, start: Optional[float]) -> None:
+        """Open a new, empty window starting at start."""
+        self.start = start
+        self.end = start
+        self.count = 0
+        self.total = 0.0
+        self.low = math.inf
+        self.high = -math.inf
+
+    def _close(self) -> WindowResult:
+        """Emit the open window and remember it."""
+        end = self.end
+        if self.span is not None and self.start is not None:
+            end = self.start + self.span
+        result = WindowResult(self.start, end, self.count, self.total,
+                              self.low, self.high)
+        self.closed.append(result)
+        return result
+
+    def push(self, value: float,
+             ts: Optional[float] = None) -> List[WindowResult]:
+        """Add a value observed at ts and return the windows it closed."""
+        ts = time.time() if ts is None else ts
+        emitted: List[WindowResult] = []
+        if self.span is not None:
+            start = ts - ts % self.span
+            if self.start is None:
+                self._reset(start)
+            elif start > self.start:
+                if self.count:
+                    emitted.append(self._close())
+                self._reset(start)
+        elif self.start is None:
+            self._reset(ts)
+
+        self.count += 1
+        self.total += value
+        self.low = min(self.low, value)
+        self.high = max(self.high, value)
+        self.end = ts if self.end is None else max(self.end, ts)
+        if self.size is not None and self.count >= self.size:
+            emitted.append(self._close())
+            self._reset(None)
+        return emitted
+
+    def advance(self, ts: float) -> List[WindowResult]:
+        """
+        Close the open time window once ts has reached its end, without
+        waiting for a newer value, and return it.
+        """
+        if (self.span is None or self.start is None
+                or ts < self.start + self.span):
+            return []
+        emitted = [self._close()] if self.count else []
+        self._reset(None)
+        return emitted
+
+    @property
+    def mean(self) -> float:
+        """Average of the values in the open window."""
+        return self.total / self.count if self.count else 0.0
+
+
+class EventTimeWindow():
+    """
+    Event-time tumbling windows behind a watermark. Values may arrive out
+    of order: they wait in a bounded reorder heap until the watermark
+    (the newest event time minus the allowed lateness) passes them, and
+    are then released in event-time order into the window they belong
+    to. Values older than the watermark are counted in self.dropped and
+    discarded, so the buffer never holds more than the lateness budget
+    (and never more than max_buffer values).
+    """
+
+    def __init__(self, span: float, lateness: float,
+                 max_buffer: int = 100_000, keep: int = 64) -> None:
+        """Close a window every span seconds of event time."""
+        self.window = TumblingWindow(span=span, keep=keep)
+        self.lateness: float = lateness
+        self.max_buffer: int = max_buffer
+        self.watermark: float = -math.inf
+        self.newest: float = -math.inf
+        self.dropped: int = 0
+        self.reordered: int = 0
+        self._buffer: List[Tuple[float, int, float]] = []
+        self._seq: int = 0
+
+    @property
+    def closed(self) -> Deque[WindowResult]:
+        """Most recent closed windows."""
+        return self.window.closed
+
+    def __len__(self) -> int:
+        """Return the number of values waiting in the reorder buffer."""
+        return len(self._buffer)
+
+    def push(self, value: float,
+             ts: Optional[float] = None) -> List[WindowResult]:
+        """Add a value with event time ts; return the windows it closed."""
+        ts = time.time() if ts is None else ts
+        if ts < self.watermark:
+            self.dropped += 1
+            return []
+        if ts < self.newest:
+            self.reordered += 1
+        heapq.heappush(self._buffer, (ts, self._seq, value))
+        self._seq += 1
+        self.newest = max(self.newest, ts)
+        watermark = self.newest - self.lateness
+        if len(self._buffer) > self.max_buffer:
+            watermark = max(watermark, self._buffer[0][0])
+        return self.advance(watermark)
+
+    def advance(self, watermark: float) -> List[WindowResult]:
+        """
+        Move the watermark forward, releasing the buffered values it has
+        passed and returning the windows that are now complete.
+        """
+        if watermark <= self.watermark:
+            return []
+        self.watermark = watermark
+        emitted: List[WindowResult] = []
+        buffer = self._buffer
+        while buffer and buffer[0][0] <= watermark:
+            ts, _, value = heapq.heappop(buffer)
+            emitted.extend(self.window.push(value, ts))
+        emitted.extend(self.window.advance(watermark))
+        return emitted
+
+    def flush(self) -> List[WindowResult]:
+        """Release everything at the end of the stream."""
+        return self.advance(math.inf)
+
+
+class SpaceSaving():
+    """
+    Space-Saving heavy-hitter tracker holding at most capacity counters.
+    Keys are kept in buckets by count, so every update is O(1): a missing
+    key takes over a counter with the minimum count. Reported counts are
+    upper bounds that overestimate by at most the key's error.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Track at most capacity distinct keys."""
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1")
+        self.capacity: int = capacity
+        self.counts: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+        self._buckets: Dict[int, set] = {}
+        self._min: int = 0
+
+    def add(self, key: str) -> None:
+        """Count one occurrence of key."""
+        count = self.counts.get(key)
+        if count is not None:
+            self._move(key, count, count + 1)
+            return
+        if len(self.counts) < self.capacity:
+            self.counts[key] = 1
+            self.errors[key] = 0
+            self._buckets.setdefault(1, set()).add(key)
+            self._min = 1
+            return
+
+        floor = self._min
+        bucket = self._buckets[floor]
+        victim = bucket.pop()
+        del self.counts[victim]
+        del self.errors[victim]
+        if not bucket:
+            del self._buckets[floor]
+            self._min = floor + 1
+        self.counts[key] = floor + 1
+        self.errors[key] = floor
+        self._buckets.setdefault(floor + 1, set()).add(key)
+
+    def _move(self, key: str, old: int, new: int) -> None:
+        """Move key from the old count bucket to the new one."""
+        bucket = self._buckets[old]
+        bucket.discard(key)
+        if not bucket:
+            del self._buckets[old]
+            if self._min == old:
+                self._min = new
+        self._buckets.setdefault(new, set()).add(key)
+        self.counts[key] = new
+
+    def top(self, k: Optional[int] = None) -> List[Tuple[str, int, int]]:
+        """Return up to k (key, count, error) entries, largest first."""
+        ranked = sorted(self.counts.items(), key=lambda item: -item[1])
+        return [(key, count, self.errors[key])
+                for key, count in ranked[:k]]
+
+
+class KLLSketch():
+    """
+    KLL quantile sketch. Values enter level 0; a full level is sorted and
+    every other value is promoted one level up with twice the weight, so
+    memory stays around k * log(n / k) values. Sketches built on separate
+    shards merge by concatenating their levels.
+    """
+
+    def __init__(self, k: int = 200, seed: Optional[int] = None) -> None:
+        """Set the accuracy parameter k (higher is more precise)."""
+        self.k: int = k
+        self.count: int = 0
+        self.levels: List[List[float]] = []
+        self._size: int = 0
+        self._max_size: int = 0
+        self._rng = random.Random(seed)
+        self._grow()
+
+    def _grow(self) -> None:
+        """Add a level on top and recompute the total capacity."""
+        self.levels.append([])
+        self._max_size = sum(self._capacity(h)
+                             for h in range(len(self.levels)))
+
+    def _capacity(self, height: int) -> int:
+        """Capacity of a level; lower levels shrink geometrically."""
+        depth = len(self.levels) - height - 1
+        return int(math.ceil(self.k * (2 / 3) ** depth)) + 1
+
+    def update(self, value: float) -> None:
+        """Add one value to the sketch."""
+        self.levels[0].append(value)
+        self._size += 1
+        self.count += 1
+        if self._size >= self._max_size:
+            self._compress()
+
+    def extend(self, values: Iterable[float]) -> None:
+        """
+        Add many values at once. They enter level 0 in slices no larger
+        than the free capacity, with a compaction between slices, so the
+        sketch compacts at the same points as repeated update() calls.
+        """
+        values = iter(values)
+        while True:
+            level = self.levels[0]
+            before = len(level)
+            level.extend(islice(values, max(self._max_size - self._size, 1)))
+            added = len(level) - before
+            if not added:
+                return
+            self._size += added
+            self.count += added
+            if self._size >= self._max_size:
+                self._compress()
+
+    def _compress(self) -> None:
+        """Compact every level that is over capacity."""
+        for height in range(len(self.levels)):
+            items = self.levels[height]
+            if len(items) < self._capacity(height):
+                continue
+            if height + 1 == len(self.levels):
+                self._grow()
+            items.sort()
+            start = len(items) % 2
+            offset = self._rng.getrandbits(1)
+            self.levels[height + 1].extend(items[start + offset::2])
+            self.levels[height] = items[:start]
+        self._size = sum(len(items) for items in self.levels)
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        """Fold another sketch into this one."""
+        while len(self.levels) < len(other.levels):
+            self._grow()
+        for height, items in enumerate(other.levels):
+            self.levels[height].extend(items)
+        self.count += other.count
+        self._size = sum(len(items) for items in self.levels)
+        while self._size >= self._max_size:
+            self._compress()
+        return self
+
+    def quantiles(self, qs: Iterable[float]) -> List[float]:
+        """Estimate the value at each requested quantile in [0, 1]."""
+        weighted = sorted((value, 1 << height)
+                          for height, items in enumerate(self.levels)
+                          for value in items)
+        if not weighted:
+            return [math.nan for _ in qs]
+        total = sum(weight for _, weight in weighted)
+        results = []
+        for q in qs:
+            target = q * total
+            seen = 0
+            for value, weight in weighted:
+                seen += weight
+                if seen >= target:
+                    break
+            results.append(value)
+        return results
+
+
+class _BitWriter():
+    """Append-only bit buffer, most significant bit first."""
+
+    __slots__ = ("data", "acc", "bits")
+
+    def __init__(self) -> None:
+        """Start with an empty buffer."""
+        self.data = bytearray()
+        self.acc: int = 0
+        self.bits: int = 0
+
+    def write(self, value: int, width: int) -> None:
+        """Append the low width bits of a non-negative value."""
+        self.acc = (self.acc << width) | value
+        self.bits += width
+        while self.bits >= 8:
+            self.bits -= 8
+            self.data.append(self.acc >> self.bits)
+            self.acc &= (1 << self.bits) - 1
+
+    def getvalue(self) -> bytes:
+        """Return the bits written so far, zero-padded to whole bytes."""
+        if not self.bits:
+            return bytes(self.data)
+        return bytes(self.data) + bytes([self.acc << (8 - self.bits)])
+
+
+class _BitReader():
+    """Reads back what a _BitWriter wrote."""
+
+    __slots__ = ("data", "pos", "acc", "bits")
+
+    def __init__(self, data: bytes) -> None:
+        """Start reading at the first bit of data."""
+        self.data = data
+        self.pos: int = 0
+        self.acc: int = 0
+        self.bits: int = 0
+
+    def read(self, width: int) -> int:
+        """Consume width bits and return them as a non-negative integer."""
+        while self.bits < width:
+            self.acc = (self.acc << 8) | self.data[self.pos]
+            self.pos += 1
+            self.bits += 8
+        self.bits -= width
+        value = self.acc >> self.bits
+        self.acc &= (1 << self.bits) - 1
+        return value
+
+
+def _signed(value: int, width: int) -> int:
+    """Interpret width bits as a two's complement integer."""
+    return value - (1 << width) if value >> (width - 1) else value
+
+
+class _GorillaEncoder():
+    """
+    Encoder of one open history block. Timestamps are stored as
+    delta-of-deltas in variable-size buckets and every float column as the
+    XOR with its previous value, reusing the previous window of meaningful
+    bits when the new one fits inside it.
+    """
+
+    __slots__ = ("out", "count", "start", "end", "ts", "delta", "prev",
+                 "lead", "trail")
+
+    def __init__(self, width: int) -> None:
+        """Prepare an empty block for width float columns."""
+        self.out = _BitWriter()
+        self.count: int = 0
+        self.start: int = 0
+        self.end: int = 0
+        self.ts: int = 0
+        self.delta: int = 0
+        self.prev: List[int] = [0] * width
+        self.lead: List[int] = [64] * width
+        self.trail: List[int] = [0] * width
+
+    def add(self, ts: int, values: Iterable[int]) -> None:
+        """Encode one timestamp and the raw IEEE 754 bits of its values."""
+        out = self.out
+        if not self.count:
+            self.start = self.end = self.ts = ts
+            out.write(ts & _MASK64, 64)
+            for i, bits in enumerate(values):
+                out.write(bits, 64)
+                self.prev[i] = bits
+            self.count = 1
+            return
+
+        self.start = min(self.start, ts)
+        self.end = max(self.end, ts)
+        delta = ts - self.ts
+        dod = delta - self.delta
+        if not dod:
+            out.write(0, 1)
+        else:
+            for i, width in enumerate(_DOD_WIDTHS):
+                half = 1 << (width - 1)
+                if -half <= dod < half:
+                    out.write((1 << (i + 2)) - 2, i + 2)
+                    out.write(dod & ((1 << width) - 1), width)
+                    break
+            else:
+                out.write(0b1111, 4)
+                out.write(dod & _MASK64, 64)
+        self.delta = delta
+        self.ts = ts
+
+        for i, bits in enumerate(values):
+            xor = bits ^ self.prev[i]
+            self.prev[i] = bits
+            if not xor:
+                out.write(0, 1)
+                continue
+            lead = min(64 - xor.bit_length(), 31)
+            trail = (xor & -xor).bit_length() - 1
+            if lead >= self.lead[i] and trail >= self.trail[i]:
+                out.write(0b10, 2)
+                out.write(xor >> self.trail[i],
+                          64 - self.lead[i] - self.trail[i])
+            else:
+                size = 64 - lead - trail
+                out.write(0b11, 2)
+                out.write(lead, 5)
+                out.write(size - 1, 6)
+                out.write(xor >> trail, size)
+                self.lead[i] = lead
+                self.trail[i] = trail
+        self.count += 1
+
+
+def _decode_block(data: bytes, count: int,
+                  width: int) -> Tuple[array, List[array]]:
+    """Decode a block into a timestamp column and width bit columns."""
+    reader = _BitReader(data)
+    read = reader.read
+    stamps = array("q")
+    columns = [array("Q") for _ in range(width)]
+    if not count:
+        return stamps, columns
+    ts = _signed(read(64), 64)
+    stamps.append(ts)
+    prev = [read(64) for _ in range(width)]
+    for column, bits in zip(columns, prev):
+        column.append(bits)
+    lead = [0] * width
+    trail = [0] * width
+    delta = 0
+    for _ in range(count - 1):
+        if read(1):
+            for width_dod in _DOD_WIDTHS:
+                if not read(1):
+                    delta += _signed(read(width_dod), width_dod)
+                    break
+            else:
+                delta += _signed(read(64), 64)
+        ts += delta
+        stamps.append(ts)
+        for i in range(width):
+            if read(1):
+                if read(1):
+                    lead[i] = read(5)
+                    trail[i] = 64 - lead[i] - read(6) - 1
+                prev[i] ^= read(64 - lead[i] - trail[i]) << trail[i]
+            columns[i].append(prev[i])
+    return stamps, columns
+
+
+class HistoryBlock(NamedTuple):
+    """Block of compressed readings with its timestamp bounds."""
+
+    start: int
+    end: int
+    count: int
+    data: bytes
+
+
+class SensorHistory():
+    """
+    Append-only store of a sensor stream's raw readings, compressed with
+    the Gorilla scheme into blocks of block_size readings. Timestamps are
+    integers (milliseconds for SensorStream). Sealed blocks are immutable
+    and are only decoded when a range query overlaps them.
+    """
+
+    def __init__(self, block_size: int = 1024) -> None:
+        """Start an empty history cut into blocks of block_size readings."""
+        self.block_size: int = block_size
+        self.blocks: List[HistoryBlock] = []
+        self._open = _GorillaEncoder(len(SENSOR_FIELDS))
+
+    def __len__(self) -> int:
+        """Return the number of stored readings."""
+        return sum(block.count for block in self.blocks) + self._open.count
+
+    @property
+    def nbytes(self) -> int:
+        """Compressed size of the history in bytes."""
+        out = self._open.out
+        return sum(len(block.data) for block in self.blocks) \
+            + len(out.data) + (1 if out.bits else 0)
+
+    def append(self, ts: int, temp: float, humidity: float,
+               pressure: float) -> None:
+        """Add one reading."""
+        bits = _READING_BITS.unpack(_READING.pack(temp, humidity, pressure))
+        self._add(ts, bits)
+
+    def extend(self, stamps: Iterable[int], batch: SensorBatch) -> None:
+        """Add a SensorBatch, one timestamp per reading."""
+        columns = []
+        for name in SENSOR_FIELDS:
+            bits = array("Q")
+            bits.frombytes(batch.column(name).tobytes())
+            columns.append(bits)
+        for ts, *values in zip(stamps, *columns):
+            self._add(ts, values)
+
+    def _add(self, ts: int, bits: Iterable[int]) -> None:
+        """Encode one reading and seal the open block once it is full."""
+        self._open.add(ts, bits)
+        if self._open.count >= self.block_size:
+            self.seal()
+
+    def seal(self) -> None:
+        """Close the open block so it becomes immutable."""
+        block = self._open
+        if block.count:
+            self.blocks.append(HistoryBlock(block.start, block.end,
+                                            block.count, block.out.getvalue()))
+            self._open = _GorillaEncoder(len(SENSOR_FIELDS))
+
+    def query(self, start: Optional[int] = None,
+              end: Optional[int] = None) -> Tuple[array, SensorBatch]:
+        """
+        Decode the readings with start <= ts <= end (all by default) and
+        return their timestamps with the readings as a SensorBatch.
+        """
+        low = -_MASK64 if start is None else start
+        high = _MASK64 if end is None else end
+        open_block = self._open
+        candidates = self.blocks + [HistoryBlock(
+            open_block.start, open_block.end, open_block.count,
+            open_block.out.getvalue())]
+        stamps = array("q")
+        batch = SensorBatch()
+        for block in candidates:
+            if not block.count or block.end < low or block.start > high:
+                continue
+            times, columns = _decode_block(block.data, block.count,
+                                           len(SENSOR_FIELDS))
+            keep = None
+            if block.start < low or block.end > high:
+                keep = [i for i, ts in enumerate(times) if low <= ts <= high]
+                times = array("q", (times[i] for i in keep))
+            stamps.extend(times)
+            for name, bits in zip(SENSOR_FIELDS, columns):
+                if keep is not None:
+                    bits = array("Q", (bits[i] for i in keep))
+                batch.column(name).frombytes(bits.tobytes())
+        return stamps, batch
+
+
+class Anomaly(NamedTuple):
+    """Transaction flagged by an AnomalyDetector."""
+
+    account: str
+    amount: float
+    zscore: float
+    ewma_score: float
+
+
+class _AccountState():
+    """Rolling window and EWMA state of one account, in minor units."""
+
+    __slots__ = ("window", "total", "squares", "ewma", "ewvar")
+
+    def __init__(self, size: int) -> None:
+        """Start with an empty window of the given size."""
+        self.window: Deque[int] = deque(maxlen=size)
+        self.total: int = 0
+        self.squares: int = 0
+        self.ewma: float = 0.0
+        self.ewvar: float = 0.0
+
+
+class AnomalyDetector():
+    """
+    Per-account streaming anomaly detector. Every account keeps the last
+    window amounts with their exact integer sum and sum of squares for a
+    rolling z-score, plus an exponentially weighted mean and variance, so
+    each transaction is scored and folded in with O(1) work. At most
+    max_accounts accounts are tracked; the least recently seen account is
+    forgotten first.
+    """
+
+    def __init__(self, window: int = 32, threshold: float = 3.0,
+                 alpha: float = 0.1, warmup: int = 8,
+                 max_accounts: int = 10_000, scale: int = 100) -> None:
+        """
+        Flag transactions whose rolling or EWMA score exceeds threshold
+        standard deviations, once an account has seen warmup transactions.
+        Amounts are compared in minor units (scale per unit).
+        """
+        self.window: int = window
+        self.threshold: float = threshold
+        self.alpha: float = alpha
+        self.warmup: int = warmup
+        self.max_accounts: int = max_accounts
+        self.scale: int = scale
+        self.accounts: "OrderedDict[str, _AccountState]" = OrderedDict()
+
+    def update(self, account: str, amount: float) -> Optional[Anomaly]:
+        """
+        Score one transaction against its account's history, then add it
+        to that history. Returns an Anomaly when it is flagged.
+        """
+        state = self.accounts.get(account)
+        if state is None:
+            state = self.accounts[account] = _AccountState(self.window)
+            if len(self.accounts) > self.max_accounts:
+                self.accounts.popitem(last=False)
+        else:
+            self.accounts.move_to_end(account)
+
+        units = round(amount * self.scale)
+        window = state.window
+        count = len(window)
+        anomaly = None
+        if count >= self.warmup:
+            mean = state.total / count
+            var = max(state.squares / count - mean * mean, 0.0)
+            zscore = (units - mean) / (math.sqrt(var) or 1.0)
+            ewma_score = (units - state.ewma) / (math.sqrt(state.ewvar)
+                                                 or 1.0)
+            if max(abs(zscore), abs(ewma_score)) > self.threshold:
+                anomaly = Anomaly(account, amount, zscore, ewma_score)
+
+        if count == window.maxlen:
+            old = window[0]
+            state.total -= old
+            state.squares -= old * old
+        window.append(units)
+        state.total += units
+        state.squares += units * units
+        if count:
+            diff = units - state.ewma
+            incr = self.alpha * diff
+            state.ewma += incr
+            state.ewvar = (1 - self.alpha) * (state.ewvar + diff * incr)
+        else:
+            state.ewma = float(units)
+        return anomaly
 
 
 class DataStream(ABC):
     """Abstract base class for all data stream types."""
 
+    kind: str = "Data"
+    unit: str = "items"
+
     def __init__(self, stream_id: str):
         """Initialize the stream with a unique identifier."""
         self.stream_id: str = stream_id
+        self.windows: Dict[str, Tuple[Any, Optional[str]]] = {}
+
+    def add_window(self, name: str, window: Any,
+                   field: Optional[str] = None) -> None:
+        """
+        Attach a SlidingWindow or TumblingWindow fed by every processed
+        batch; field selects which value of each record it aggregates.
+        """
+        self.windows[name] = (window, field)
+
+    def window_values(self, data_batch: Any, field: Optional[str],
+                      now: float) -> Iterable[Tuple[float, float]]:
+        """Yield the (timestamp, value) pairs a batch feeds to a window."""
+        return ()
+
+    def dump_state(self) -> bytes:
+        """Serialize the stream counters to a compact binary record."""
+        return _COUNTERS.pack(self.ops, self.errors)
+
+    def load_state(self, data: Any) -> None:
+        """Restore the stream counters from a dump_state() record."""
+        self.ops, self.errors = _COUNTERS.unpack_from(data)
+
+    def _update_windows(self, data_batch: Any) -> None:
+        """Push a processed batch into every attached window."""
+        if not self.windows:
+            return
+        now = time.time()
+        for window, field in self.windows.values():
+            for ts, value in self.window_values(data_batch, field, now):
+                window.push(value, ts)
 
     @abstractmethod
-    def process_batch(self, data_batch: List[Any]) -> str:
-        """Process a batch of data and return a summary string."""
+    def process_batch(self, data_batch: List[Any],
+                      render: bool = True) -> str:
+        """
+        Process a batch of data and return a summary string. With render
+        False only a short count line is built, for callers that drop it.
+        """
         pass
 
+    def score(self, data_batch: Any) -> List[Any]:
+        """
+        Score a raw batch before it is filtered and return what it flagged.
+        Streams without scoring flag nothing.
+        """
+        return []
+
     def filter_data(self, data_batch: List[Any],
                     criteria: Optional[str] = None) -> List[Any]:
         """Filter data based on given criteria."""
@@ -38,50 +1097,199 @@ class DataStream(ABC):
 class SensorStream(DataStream):
     """Stream for environmental sensor data."""
 
-    def __init__(self, stream_id: str):
+    kind = "Sensor"
+    unit = "readings"
+
+    def __init__(self, stream_id: str,
+                 thresholds: Optional[Dict[str, Tuple[float, float]]] = None,
+                 sketch_k: int = 200,
+                 frame_layout: Optional[SensorFrameLayout] = None,
+                 history: Optional[SensorHistory] = None):
+        """
+        Configure per-field thresholds, the accuracy of the per-field KLL
+        quantile sketches, the layout of binary frame input and an
+        optional compressed store for the raw readings.
+        """
         super().__init__(stream_id)
         self.avg: float = 0
         self.ops: int = 0
         self.errors: int = 0
+        self.means: Dict[str, float] = dict.fromkeys(SENSOR_FIELDS, 0.0)
+        self.thresholds: Dict[str, Tuple[float, float]] = {
+            **SENSOR_THRESHOLDS, **(thresholds or {})
+        }
+        self.rejects: Dict[str, int] = dict.fromkeys(self.thresholds, 0)
+        self.sketches: Dict[str, KLLSketch] = {
+            name: KLLSketch(sketch_k) for name in SENSOR_FIELDS
+        }
+        self.frame_layout: SensorFrameLayout = frame_layout or SENSOR_FRAME
+        self.history: Optional[SensorHistory] = history
 
-    def process_batch(self, data_batch: List[Any]) -> str:
-        """Calculate averages and format sensor output."""
+    def decode(self, data_batch: Any) -> Any:
+        """Turn packed binary frames into a SensorBatch; pass others on."""
+        if isinstance(data_batch, (bytes, bytearray, memoryview)):
+            return SensorBatch.from_frames(data_batch, self.frame_layout)
+        return data_batch
+
+    def process_batch(self, data_batch: Any, render: bool = True) -> str:
+        """
+        Calculate averages and format sensor output; the per-reading line
+        is only built when render is True.
+        """
+        data_batch = self.decode(data_batch)
+        if isinstance(data_batch, SensorBatch):
+            return self.process_columns(data_batch)
+
+        self._update_windows(data_batch)
         if not data_batch:
+            # filter_data may reject every reading of a batch
             self.avg = 0.0
+            self.ops = 0
+            self.means = dict.fromkeys(SENSOR_FIELDS, 0.0)
+            return "Processing sensor batches: "
+        for name, sketch in self.sketches.items():
+            sketch.extend(item[name] for item in data_batch)
+        if self.history is not None:
+            now = time.time()
+            for item in data_batch:
+                self.history.append(int(item.get("ts", now) * 1000),
+                                    item["temp"], item["humidity"],
+                                    item["pressure"])
 
         self.avg = round(sum(v["temp"] for v in data_batch)
                          / len(data_batch), 2)
-        self.ops = sum(len(value) for value in data_batch)
+        self.ops = len(data_batch) * len(SENSOR_FIELDS)
+        if not render:
+            return f"Processing sensor batches: {len(data_batch)} readings"
 
-        line: str = ""
         template: str = "[temp:{temp}, " \
             "humidity:{humidity}, pressure:{pressure}]"
-        for item in data_batch:
-            line += template.format(**item)
+        line = "".join(template.format(**item) for item in data_batch)
         return f"Processing sensor batches: {line}"
 
+    def process_columns(self, batch: SensorBatch) -> str:
+        """
+        Average every column of a SensorBatch with vectorized operations
+        and summarize it without formatting individual readings.
+        """
+        self._update_windows(batch)
+        for name in SENSOR_FIELDS:
+            self.means[name] = _column_mean(batch.column(name))
+            self.sketches[name].extend(batch.column(name))
+        if self.history is not None:
+            now = int(time.time() * 1000)
+            self.history.extend([now] * len(batch), batch)
+        self.avg = round(self.means["temp"], 2)
+        self.ops = len(batch) * len(SENSOR_FIELDS)
+
+        template = "Processing sensor batches: {} readings " \
+            "[temp:{:.2f}, humidity:{:.2f}, pressure:{:.2f}]"
+        return template.format(len(batch), *self.means.values())
+
+    def window_values(self, data_batch: Any, field: Optional[str],
+                      now: float) -> Iterable[Tuple[float, float]]:
+        """
+        Feed one sensor field (temp by default) to a window, using the
+        reading's "ts" when present and the arrival time otherwise.
+        """
+        field = field or "temp"
+        if isinstance(data_batch, SensorBatch):
+            return ((now, value) for value in data_batch.column(field))
+        return ((item.get("ts", now), item[field]) for item in data_batch)
+
+    def quantiles(self, qs: Iterable[float] = (0.5, 0.95, 0.99)
+                  ) -> Dict[str, Dict[str, float]]:
+        """Estimate p50/p95/p99 (or the given quantiles) for every field."""
+        qs = list(qs)
+        labels = [f"p{q * 100:g}" for q in qs]
+        return {
+            name: dict(zip(labels, sketch.quantiles(qs)))
+            for name, sketch in self.sketches.items()
+        }
+
+    def merge_sketches(self, other: "SensorStream") -> None:
+        """Fold the quantile sketches of another shard of this stream."""
+        for name, sketch in self.sketches.items():
+            sketch.merge(other.sketches[name])
+
+    def dump_state(self) -> bytes:
+        """
+        Serialize counters, rounded and per-field averages and per-field
+        reject counts.
+        """
+        return _SENSOR_STATE.pack(
+            self.ops, self.errors, self.avg,
+            *(self.means[f] for f in SENSOR_FIELDS),
+            *(self.rejects.get(f, 0) for f in SENSOR_FIELDS)
+        )
+
+    def load_state(self, data: Any) -> None:
+        """Restore the counters, averages and rejects of a dump_state()."""
+        self.ops, self.errors, self.avg, *values = \
+            _SENSOR_STATE.unpack_from(data)
+        count = len(SENSOR_FIELDS)
+        self.means = dict(zip(SENSOR_FIELDS, values[:count]))
+        self.rejects.update(zip(SENSOR_FIELDS, values[count:]))
+
+    def select(self, data_batch: Any) -> Tuple[Any, Dict[str, int]]:
+        """
+        Return the indices of readings inside every threshold, plus how
+        many readings each field rejected. A reading is charged to the
+        first field it fails. SensorBatch input is checked with one
+        vectorized boolean mask per field when NumPy is available.
+        """
+        rejects = dict.fromkeys(self.thresholds, 0)
+        if isinstance(data_batch, SensorBatch) and np is not None:
+            keep = np.ones(len(data_batch), dtype=bool)
+            for name, (low, high) in self.thresholds.items():
+                values = np.frombuffer(data_batch.column(name))
+                failed = keep & ((values < low) | (values > high))
+                rejects[name] = int(np.count_nonzero(failed))
+                keep &= ~failed
+            return np.flatnonzero(keep), rejects
+
+        names = list(self.thresholds)
+        bounds = list(self.thresholds.values())
+        if isinstance(data_batch, SensorBatch):
+            rows: Iterable[Any] = zip(*(data_batch.column(name)
+                                        for name in names))
+        else:
+            rows = ([item[name] for name in names] for item in data_batch)
+        indices = []
+        for i, row in enumerate(rows):
+            for name, value, (low, high) in zip(names, row, bounds):
+                if not low <= value <= high:
+                    rejects[name] += 1
+                    break
+            else:
+                indices.append(i)
+        return indices, rejects
+
     def filter_data(self, data_batch: List[Any],
                     criteria: Optional[str] = None) -> List[Dict[str, float]]:
-        """Apply thresholds to sensor readings and count errors."""
+        """
+        Keep only the readings inside the thresholds, counting the rejected
+        ones as errors and per failing field in self.rejects.
+        """
         if not criteria:
             return data_batch
 
-        for value in data_batch:
-            if not (-20 <= value['temp'] <= 25):
-                self.errors += 1
-            elif not (0 <= value['humidity'] <= 95):
-                self.errors += 1
-            elif not (0 <= value['pressure'] <= 2500):
-                self.errors += 1
-        return data_batch
+        data_batch = self.decode(data_batch)
+        indices, rejects = self.select(data_batch)
+        for name, count in rejects.items():
+            self.rejects[name] += count
+            self.errors += count
+        if isinstance(data_batch, SensorBatch):
+            return data_batch.take(indices)
+        return [data_batch[i] for i in indices]
 
     def get_stats(self) -> Dict[str, Union[str, int, float]]:
         """Return a dictionary containing stream statistics."""
         stats: Dict[str, Union[str, int, float]] = {
             "id": self.stream_id,
-            "type": "Sensor",
+            "type": self.kind,
             "subtype": "Environmental Data",
-            "opt": "readings",
+            "opt": self.unit,
             "qty": self.ops,
             "avgtmp": self.avg,
             "errors": self.errors
@@ -97,46 +1305,207 @@ class SensorStream(DataStream):
 class TransactionStream(DataStream):
     """Stream for financial transaction data."""
 
-    def __init__(self, stream_id: str):
+    kind = "Transaction"
+    unit = "operations"
+
+    def __init__(self, stream_id: str,
+                 limits: Tuple[float, float] = (-200, 200),
+                 scale: int = 100,
+                 detector: Optional[AnomalyDetector] = None,
+                 on_anomaly: Optional[Callable[[Anomaly], Any]] = None):
+        """
+        Configure the range limits, the minor-unit scale and an optional
+        anomaly detector whose flags are passed to on_anomaly. Batches
+        hold plain amounts, (account, amount) tuples or dicts with
+        "account" and "amount"; plain amounts belong to the stream id.
+        """
         super().__init__(stream_id)
         self.ops: int = 0
         self.sum: Union[str, int] = 0
         self.errors: int = 0
+        self.limits: Tuple[float, float] = limits
+        self.rejects: Dict[str, int] = {"below": 0, "above": 0}
+        self.scale: int = scale
+        self.buy_units: int = 0
+        self.sell_units: int = 0
+        self.detector: Optional[AnomalyDetector] = detector
+        self.on_anomaly: Optional[Callable[[Anomaly], Any]] = on_anomaly
+        self.anomalies: int = 0
 
-    def process_batch(self, data_batch: List[Any]) -> str:
-        """Process buys/sells and calculate net flow."""
+    @property
+    def net_units(self) -> int:
+        """Running net flow across all batches, in minor units."""
+        return self.buy_units - self.sell_units
+
+    def process_batch(self, data_batch: Any, render: bool = True) -> str:
+        """
+        Process buys/sells and calculate net flow. Totals are aggregated
+        in integer minor units; the per-transaction line is only built
+        when render is True. Anomaly scoring is the separate score() step,
+        run on the batch before out-of-range transactions are dropped.
+        """
+        data_batch = self.amounts(data_batch)
         self.ops = len(data_batch)
-        total: float = 0
+        buy, sell = self.aggregate(data_batch)
+        self._update_windows(data_batch)
+        self.sum = format_units(buy - sell, self.scale)
+        if not render:
+            return f"Processing transaction batches: {self.ops} operations"
+
         line: List[str] = []
         for v in data_batch:
             key: str = "sell" if v < 0 else "buy"
             value: float = -v if key == "sell" else v
-            total += v
             line.append(f"{key}:{value}")
-        sign: str = "+" if total > 0 else ""
-        self.sum = f"{sign}{total}"
         return f"Processing transaction batches: {', '.join(line)}"
 
+    def keyed(self, records: Iterable[Any]
+              ) -> Generator[Tuple[str, float], None, None]:
+        """Yield (account, amount) for every kind of transaction record."""
+        for item in records:
+            if isinstance(item, dict):
+                yield item["account"], item["amount"]
+            elif isinstance(item, tuple):
+                yield item
+            else:
+                yield self.stream_id, item
+
+    def amounts(self, data_batch: Any) -> Any:
+        """Return the amounts of a batch, dropping any account keys."""
+        if len(data_batch) and isinstance(data_batch[0], (tuple, dict)):
+            return [amount for _, amount in self.keyed(data_batch)]
+        return data_batch
+
+    def detect(self, records: Iterable[Any]
+               ) -> Generator[Anomaly, None, None]:
+        """
+        Score transactions one by one as the iterable produces them and
+        yield each flagged one immediately, so a live feed is checked in
+        real time rather than per batch.
+        """
+        if self.detector is None:
+            self.detector = AnomalyDetector(scale=self.scale)
+        update = self.detector.update
+        for account, amount in self.keyed(records):
+            anomaly = update(account, amount)
+            if anomaly is not None:
+                self.anomalies += 1
+                yield anomaly
+
+    def score(self, data_batch: Any) -> List[Anomaly]:
+        """
+        Run a whole batch through the detector, so out-of-range amounts
+        are flagged too, pass every flag to on_anomaly and return them.
+        """
+        anomalies: List[Anomaly] = []
+        if self.detector is None:
+            return anomalies
+        for anomaly in self.detect(data_batch):
+            if self.on_anomaly is not None:
+                self.on_anomaly(anomaly)
+            anomalies.append(anomaly)
+        return anomalies
+
+    def window_values(self, data_batch: Any, field: Optional[str],
+                      now: float) -> Iterable[Tuple[float, float]]:
+        """Feed every signed transaction amount at its arrival time."""
+        return ((now, value) for value in data_batch)
+
+    def dump_state(self) -> bytes:
+        """
+        Serialize counters, fixed-point totals, the anomaly count and the
+        last net flow.
+        """
+        return _TRANS_STATE.pack(
+            self.ops, self.errors, self.scale, self.buy_units,
+            self.sell_units, self.rejects["below"], self.rejects["above"],
+            self.anomalies
+        ) + _pack_str(str(self.sum))
+
+    def load_state(self, data: Any) -> None:
+        """Restore the counters and totals of a dump_state() record."""
+        (self.ops, self.errors, self.scale, self.buy_units, self.sell_units,
+         self.rejects["below"], self.rejects["above"], self.anomalies) = \
+            _TRANS_STATE.unpack_from(data)
+        self.sum = _unpack_str(data, _TRANS_STATE.size)[0]
+
+    def aggregate(self, data_batch: Any) -> Tuple[int, int]:
+        """
+        Convert a batch to integer minor units and return its buy and sell
+        volumes, adding both to the running totals.
+        """
+        scale = self.scale
+        if np is not None:
+            values = np.asarray(data_batch, dtype=np.float64)
+            units = np.rint(values * scale).astype(np.int64)
+            buy = int(units[units > 0].sum())
+            sell = -int(units[units < 0].sum())
+        else:
+            units = [round(v * scale) for v in data_batch]
+            buy = sum(filter((0).__lt__, units))
+            sell = -sum(filter((0).__gt__, units))
+        self.buy_units += buy
+        self.sell_units += sell
+        return buy, sell
+
     def filter_data(self, data_batch: List[Any],
                     criteria: Optional[str] = None) -> List[Any]:
-        """Filter transactions based on range limits."""
+        """
+        Keep only the transactions inside the range limits, counting the
+        rejected ones as errors and per side in self.rejects.
+        """
         if not criteria:
             return data_batch
-        for num in data_batch:
-            if not (-200 <= num <= 200):
-                self.errors += 1
-        return data_batch
+
+        indices, rejects = self.select(data_batch)
+        for reason, count in rejects.items():
+            self.rejects[reason] += count
+            self.errors += count
+        if np is not None and isinstance(data_batch, np.ndarray):
+            return data_batch[indices]
+        return [data_batch[i] for i in indices]
+
+    def select(self, data_batch: Any) -> Tuple[Any, Dict[str, int]]:
+        """
+        Return the indices of transactions inside the limits, plus the
+        number rejected below and above them, using vectorized boolean
+        masks when NumPy is available.
+        """
+        data_batch = self.amounts(data_batch)
+        low, high = self.limits
+        if np is not None:
+            values = np.asarray(data_batch, dtype=np.float64)
+            below = values < low
+            above = values > high
+            rejects = {"below": int(np.count_nonzero(below)),
+                       "above": int(np.count_nonzero(above))}
+            return np.flatnonzero(~(below | above)), rejects
+
+        rejects = {"below": 0, "above": 0}
+        indices = []
+        for i, num in enumerate(data_batch):
+            if num < low:
+                rejects["below"] += 1
+            elif num > high:
+                rejects["above"] += 1
+            else:
+                indices.append(i)
+        return indices, rejects
 
     def get_stats(self) -> Dict[str, Union[str, int, float]]:
         """Return a dictionary containing stream statistics."""
         stats: Dict[str, Union[str, int, float]] = {
             "id": self.stream_id,
-            "type": "Transaction",
+            "type": self.kind,
             "subtype": "Financial Data",
-            "opt": "operations",
+            "opt": self.unit,
             "qty": self.ops,
             "errors": self.errors,
-            "net": self.sum
+            "net": self.sum,
+            "buy_total": format_units(self.buy_units, self.scale, False),
+            "sell_total": format_units(self.sell_units, self.scale, False),
+            "net_total": format_units(self.net_units, self.scale),
+            "anomalies": self.anomalies
         }
         return stats
 
@@ -149,22 +1518,113 @@ class TransactionStream(DataStream):
 class EventStream(DataStream):
     """Stream for system event logs."""
 
-    def __init__(self, stream_id: str):
+    kind = "Event"
+    unit = "events"
+
+    def __init__(self, stream_id: str, top_k: Optional[int] = None):
+        """
+        Keep an exact per-type histogram, or with top_k only a bounded
+        Space-Saving tracker of the most frequent event types.
+        """
         super().__init__(stream_id)
         self.ops: int = 0
         self.errors: int = 0
         self.msg: str = "error"
+        self.histogram: Dict[str, int] = {}
+        self.heavy: Optional[SpaceSaving] = None
+        if top_k is not None:
+            self.heavy = SpaceSaving(top_k)
 
-    def process_batch(self, data_batch: List[Any]) -> str:
-        """Process event batch and join as string."""
+    def process_batch(self, data_batch: List[Any],
+                      render: bool = True) -> str:
+        """
+        Process event batch and join as string when render is True. Events
+        are plain names or carry their event time as (ts, event) tuples or
+        dicts with "ts" and "event"; attached EventTimeWindows order them
+        by that time.
+        """
         self.ops = len(data_batch)
-        line: str = ", ".join(map(str, data_batch))
+        self._update_windows(data_batch)
+        events = self.events(data_batch)
+        self.count_events(events)
+        if not render:
+            return f"Processing event batch: {self.ops} events"
+        line: str = ", ".join(map(str, events))
         return f"Processing event batch: [{line}]"
 
+    @staticmethod
+    def timed_events(data_batch: Iterable[Any], now: float
+                     ) -> Generator[Tuple[float, Any], None, None]:
+        """Yield (event time, event), using now for untimed events."""
+        for item in data_batch:
+            if isinstance(item, dict):
+                yield item.get("ts", now), item["event"]
+            elif isinstance(item, tuple):
+                yield item
+            else:
+                yield now, item
+
+    def events(self, data_batch: Any) -> List[Any]:
+        """Return the event names of a batch, dropping any timestamps."""
+        if len(data_batch) and isinstance(data_batch[0], (tuple, dict)):
+            return [event for _, event in self.timed_events(data_batch, 0)]
+        return data_batch
+
+    def dump_state(self) -> bytes:
+        """Serialize counters, status message and the event histogram."""
+        parts = [_COUNTERS.pack(self.ops, self.errors), _pack_str(self.msg),
+                 _COUNT.pack(len(self.histogram))]
+        for key, count in self.histogram.items():
+            parts.append(_pack_str(key))
+            parts.append(_HIST_ENTRY.pack(count))
+        return b"".join(parts)
+
+    def load_state(self, data: Any) -> None:
+        """Restore the counters and histogram of a dump_state() record."""
+        self.ops, self.errors = _COUNTERS.unpack_from(data)
+        self.msg, offset = _unpack_str(data, _COUNTERS.size)
+        (entries,) = _COUNT.unpack_from(data, offset)
+        offset += _COUNT.size
+        self.histogram = {}
+        for _ in range(entries):
+            key, offset = _unpack_str(data, offset)
+            (self.histogram[sys.intern(key)],) = \
+                _HIST_ENTRY.unpack_from(data, offset)
+            offset += _HIST_ENTRY.size
+
+    def count_events(self, data_batch: Iterable[Any]) -> None:
+        """Add a batch to the histogram, or to the heavy-hitter tracker."""
+        if self.heavy is not None:
+            add = self.heavy.add
+            for event in data_batch:
+                add(sys.intern(str(event)))
+            return
+        histogram = self.histogram
+        for event, count in Counter(data_batch).items():
+            key = sys.intern(str(event))
+            histogram[key] = histogram.get(key, 0) + count
+
+    def top_events(self, k: int = 10) -> List[Tuple[str, int]]:
+        """Return the k most frequent event types with their counts."""
+        if self.heavy is not None:
+            return [(key, count) for key, count, _ in self.heavy.top(k)]
+        return heapq.nlargest(k, self.histogram.items(),
+                              key=lambda item: item[1])
+
+    def window_values(self, data_batch: Any, field: Optional[str],
+                      now: float) -> Iterable[Tuple[float, float]]:
+        """
+        Feed 1 per event, or per event equal to field when one is given,
+        so windows count events over time. Timestamped events are fed at
+        their event time.
+        """
+        return ((ts, 1.0 if field is None or event == field else 0.0)
+                for ts, event in self.timed_events(data_batch, now))
+
     def filter_data(self, data_batch: List[Any],
                     criteria: Optional[str] = None) -> List[Any]:
         """Count specific error events and update status message."""
-        for data in data_batch:
+        for data in self.events(data_batch):
             if data == "error":
                 self.errors += 1
         if self.errors > 1:
@@ -175,9 +1635,9 @@ class EventStream(DataStream):
         """Return a dictionary containing stream statistics."""
         stats: Dict[str, Union[str, int, float]] = {
             "id": self.stream_id,
-            "type": "Event",
+            "type": self.kind,
             "subtype": "System Events",
-            "opt": "events",
+            "opt": self.unit,
             "qty": self.ops,
             "errors": self.errors,
             "text": self.msg
@@ -190,17 +1650,161 @@ class EventStream(DataStream):
         return template.format(self.ops, self.errors, self.msg)
 
 
+STREAM_KINDS: Dict[str, type] = {
+    cls.kind: cls for cls in (SensorStream, TransactionStream, EventStream)
+}
+
+
+class StreamTotals():
+    """Running summary of every stream of one type."""
+
+    def __init__(self, unit: str) -> None:
+        """Start with empty counters for the given unit."""
+        self.unit: str = unit
+        self.qty: int = 0
+        self.errors: int = 0
+        self.streams: int = 0
+
+
 class StreamProcess():
     """Manager to orchestrate multiple data streams."""
 
-    def __init__(self):
-        """Initialize the processor with an empty list of streams."""
-        self.streams: List[DataStream] = []
+    def __init__(self, checkpoint_path: Optional[str] = None,
+                 checkpoint_every: int = 0):
+        """
+        Initialize the processor with an empty stream registry. With a
+        checkpoint path and checkpoint_every > 0, a snapshot is written
+        every checkpoint_every processed batches.
+        """
+        self.streams: Dict[str, DataStream] = {}
+        self.totals: Dict[str, StreamTotals] = {}
         self.count: int = 0
+        self.checkpoint_path: Optional[str] = checkpoint_path
+        self.checkpoint_every: int = checkpoint_every
+        self.batches: int = 0
 
     def add_streams(self, stream: DataStream) -> None:
-        """Add a stream to the processing list."""
-        self.streams.append(stream)
+        """
+        Register a stream under its stream_id. Registering the same stream
+        again is a no-op; a different stream with a taken id is rejected.
+        """
+        known = self.streams.get(stream.stream_id)
+        if known is stream:
+            return
+        if known is not None:
+            raise ValueError(f"Stream id {stream.stream_id} already in use")
+        self.streams[stream.stream_id] = stream
+        totals = self.totals.get(stream.kind)
+        if totals is None:
+            totals = self.totals[stream.kind] = StreamTotals(stream.unit)
+        totals.streams += 1
+
+    def get_stream(self, stream_id: str) -> DataStream:
+        """Return the registered stream with this id."""
+        return self.streams[stream_id]
+
+    def ingest(self, stream: DataStream, data: Any,
+               criteria: Optional[str] = None, render: bool = True) -> str:
+        """
+        Score, filter and process one batch for a registered stream,
+        folding the batch into the per-type totals, and return the
+        processing line. Pass render=False when the line is not used.
+        """
+        self.add_streams(stream)
+        errors = stream.errors
+        stream.score(data)
+        line = stream.process_batch(stream.filter_data(data, criteria),
+                                    render)
+        self._account(stream, errors)
+        return line
+
+    def _account(self, stream: DataStream, errors_before: int) -> None:
+        """Add the batch a stream just processed to its type's totals."""
+        totals = self.totals[stream.kind]
+        totals.qty += stream.ops
+        totals.errors += stream.errors - errors_before
+        self.batches += 1
+        if (self.checkpoint_path and self.checkpoint_every
+                and self.batches % self.checkpoint_every == 0):
+            self.checkpoint()
+
+    def snapshot(self) -> bytes:
+        """
+        Serialize every registered stream and the per-type totals into one
+        compact binary snapshot.
+        """
+        parts = [_SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION,
+                                       len(self.streams))]
+        for stream in self.streams.values():
+            state = stream.dump_state()
+            parts.append(_pack_str(stream.kind))
+            parts.append(_pack_str(stream.stream_id))
+            parts.append(_COUNT.pack(len(state)))
+            parts.append(state)
+        parts.append(_COUNT.pack(len(self.totals)))
+        for kind, totals in self.totals.items():
+            parts.append(_pack_str(kind))
+            parts.append(_pack_str(totals.unit))
+            parts.append(_COUNTERS.pack(totals.qty, totals.errors))
+        return b"".join(parts)
+
+    def load_snapshot(self, data: bytes) -> int:
+        """
+        Restore a snapshot. Streams already registered under a stored id
+        keep their configuration and only get their state back; unknown
+        ids are created with default settings. Returns the stream count.
+        """
+        view = memoryview(data)
+        magic, version, count = _SNAPSHOT_HEADER.unpack_from(view)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise ValueError("Not a stream snapshot")
+        offset = _SNAPSHOT_HEADER.size
+        for _ in range(count):
+            kind, offset = _unpack_str(view, offset)
+            stream_id, offset = _unpack_str(view, offset)
+            (size,) = _COUNT.unpack_from(view, offset)
+            offset += _COUNT.size
+            stream = self.streams.get(stream_id)
+            if stream is None:
+                stream = STREAM_KINDS[kind](stream_id)
+                stream.load_state(view[offset:offset + size])
+                self.add_streams(stream)
+            else:
+                stream.load_state(view[offset:offset + size])
+            offset += size
+
+        (kinds,) = _COUNT.unpack_from(view, offset)
+        offset += _COUNT.size
+        for _ in range(kinds):
+            kind, offset = _unpack_str(view, offset)
+            unit, offset = _unpack_str(view, offset)
+            totals = self.totals.setdefault(kind, StreamTotals(unit))
+            totals.qty, totals.errors = _COUNTERS.unpack_from(view, offset)
+            offset += _COUNTERS.size
+        return count
+
+    def checkpoint(self, path: Optional[str] = None) -> int:
+        """
+        Atomically write a snapshot to path (the configured checkpoint
+        path by default) and return its size in bytes.
+        """
+        path = path or self.checkpoint_path
+        if not path:
+            raise ValueError("No checkpoint path configured")
+        data = self.snapshot()
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as file:
+            file.write(data)
+        os.replace(tmp, path)
+        return len(data)
+
+    def restore(self, path: Optional[str] = None) -> int:
+        """Load the snapshot at path and return how many streams it had."""
+        path = path or self.checkpoint_path
+        if not path:
+            raise ValueError("No checkpoint path configured")
+        with open(path, "rb") as file:
+            return self.load_snapshot(file.read())
 
     def process_all(self, data: List[Any]) -> None:
         """Process all batches at once"""
@@ -210,34 +1814,409 @@ class StreamProcess():
             print(f"\nInitializing {s_dict['type']} Stream...")
             print(f"Stream ID: {s_dict['id']}, Type: {s_dict['subtype']}")
 
-            stream.filter_data(data, criteria)
-            print(stream.process_batch(data))
+            print(self.ingest(stream, data, criteria))
             print(stream.get_analysis())
 
-            self.add_streams(stream)
-
         for line in self.batch_result():
             print(line)
 
-        s_stats = self.streams[0].get_stats()
-        t_stats = self.streams[1].get_stats()
-
         print("\nStream filtering active: High-priority data only")
 
+        sensor = self.totals.get(SensorStream.kind)
+        trans = self.totals.get(TransactionStream.kind)
         template = "Filtered results: {} critical " \
             "sensor alerts, {} large transaction"
-        print(template.format(s_stats['errors'], t_stats['errors']))
+        print(template.format(sensor.errors if sensor else 0,
+                              trans.errors if trans else 0))
 
     def batch_result(self) -> Generator[str, None, None]:
-        """Generator that yields results for all registered streams."""
+        """
+        Generator that yields the running results per stream type, without
+        visiting the individual streams.
+        """
         self.count += 1
 
         print(f"\nBatch {self.count} Results:")
 
-        for stream in self.streams:
-            stats = stream.get_stats()
+        for kind, totals in self.totals.items():
             template = "- {} data: {} {} processed"
-            yield template.format(stats['type'], stats['qty'], stats['opt'])
+            yield template.format(kind, totals.qty, totals.unit)
+
+
+class AsyncStreamProcess(StreamProcess):
+    """
+    Asyncio manager that serves many live streams from one event loop.
+    Every stream gets a bounded queue between its source and its consumer,
+    so a slow consumer applies backpressure to its own source without
+    blocking the others.
+    """
+
+    def __init__(self, maxsize: int = 8, offload: bool = False):
+        """
+        Set the per-stream queue bound. With offload, batches are processed
+        in a worker thread so heavy batches do not stall the event loop.
+        """
+        super().__init__()
+        self.maxsize: int = maxsize
+        self.offload: bool = offload
+
+    async def process_all_async(
+            self,
+            sources: Iterable[Tuple[DataStream, AsyncIterator[Any],
+                                    Optional[str]]],
+            on_result: Optional[Callable[[DataStream, str], Any]] = None
+    ) -> Dict[str, int]:
+        """
+        Consume one async iterator of batches per stream concurrently and
+        return how many batches each stream processed. on_result receives
+        each stream's analysis line after every batch. The first error
+        raised by a source or by processing is propagated.
+        """
+        pipes = []
+        processed: Dict[str, int] = {}
+        for stream, source, criteria in sources:
+            self.add_streams(stream)
+            processed[stream.stream_id] = 0
+            pipes.append(self._pipe(stream, source, criteria, processed,
+                                    on_result))
+        await asyncio.gather(*pipes)
+        return processed
+
+    async def _pipe(self, stream: DataStream, source: AsyncIterator[Any],
+                    criteria: Optional[str], processed: Dict[str, int],
+                    on_result: Optional[Callable[[DataStream, str], Any]]
+                    ) -> None:
+        """
+        Run the producer and consumer of one stream. When either fails the
+        other is cancelled, so neither is left waiting on the queue.
+        """
+        queue: asyncio.Queue = asyncio.Queue(self.maxsize)
+        tasks = [
+            asyncio.ensure_future(self._produce(source, queue)),
+            asyncio.ensure_future(self._consume(stream, queue, criteria,
+                                                processed, on_result))
+        ]
+        try:
+            done, _ = await asyncio.wait(
+                tasks, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        for task in done:
+            task.result()
+
+    async def _produce(self, source: AsyncIterator[Any],
+                       queue: asyncio.Queue) -> None:
+        """Move batches from a source into its queue, waiting when full."""
+        async for batch in source:
+            await queue.put(batch)
+        await queue.put(_END_OF_SOURCE)
+
+    async def _consume(self, stream: DataStream, queue: asyncio.Queue,
+                       criteria: Optional[str], processed: Dict[str, int],
+                       on_result: Optional[Callable[[DataStream, str], Any]]
+                       ) -> None:
+        """Filter and process batches from a queue until the source ends."""
+        while True:
+            batch = await queue.get()
+            if batch is _END_OF_SOURCE:
+                return
+            if self.offload:
+                errors = stream.errors
+                await asyncio.to_thread(self._handle, stream, batch,
+                                        criteria, False)
+                self._account(stream, errors)
+            else:
+                self.ingest(stream, batch, criteria, False)
+                await asyncio.sleep(0)
+            processed[stream.stream_id] += 1
+            if on_result is not None:
+                on_result(stream, stream.get_analysis())
+
+    @staticmethod
+    def _handle(stream: DataStream, batch: Any, criteria: Optional[str],
+                render: bool = True) -> str:
+        """Run one batch through a stream's scoring, filter and processing."""
+        stream.score(batch)
+        return stream.process_batch(stream.filter_data(batch, criteria),
+                                    render)
+
+
+def _clear_shipped(stream: DataStream) -> None:
+    """
+    Drop the mergeable state a shard worker has already handed over: the
+    quantile sketches restart empty and sealed history blocks are let go.
+    """
+    if isinstance(stream, SensorStream):
+        stream.sketches = {name: KLLSketch(sketch.k)
+                           for name, sketch in stream.sketches.items()}
+        if stream.history is not None:
+            stream.history.blocks = []
+
+
+def _stream_delta(stream: DataStream, anomalies: List[Anomaly]) -> tuple:
+    """
+    Build what a shard worker reports for one stream on "collect": its
+    dump_state() record, its windows and top-k tracker (both bounded),
+    the sketches and history blocks added since the last collect and the
+    anomalies flagged meanwhile. The shipped sketches and blocks are then
+    cleared, so the report does not grow with the stream's history.
+    """
+    windows = {name: window for name, (window, _) in stream.windows.items()}
+    sketches: Optional[Dict[str, KLLSketch]] = None
+    blocks: List[HistoryBlock] = []
+    if isinstance(stream, SensorStream):
+        sketches = stream.sketches
+        if stream.history is not None:
+            stream.history.seal()
+            blocks = stream.history.blocks
+        _clear_shipped(stream)
+    return (stream.stream_id, stream.dump_state(), windows,
+            getattr(stream, "heavy", None), sketches, blocks, anomalies)
+
+
+def _apply_delta(stream: DataStream, delta: tuple) -> None:
+    """
+    Fold a _stream_delta() report into the local copy of a stream and pass
+    the forwarded anomalies to its on_anomaly callback.
+    """
+    _, state, windows, heavy, sketches, blocks, anomalies = delta
+    stream.load_state(state)
+    for name, remote in windows.items():
+        vars(stream.windows[name][0]).update(vars(remote))
+    if heavy is not None:
+        vars(stream.heavy).update(vars(heavy))
+    if isinstance(stream, SensorStream):
+        for name, sketch in (sketches or {}).items():
+            stream.sketches[name].merge(sketch)
+        if stream.history is not None:
+            stream.history.blocks.extend(blocks)
+    callback = getattr(stream, "on_anomaly", None)
+    if callback is not None:
+        for anomaly in anomalies:
+            callback(anomaly)
+
+
+def _shard_worker(shard: int, inbox: Any, outbox: Any) -> None:
+    """
+    Worker loop of a ShardedStreamProcess. Owns the streams hashed to this
+    shard, processes their batches and, on "collect", sends back a delta
+    report (see _stream_delta) for every stream touched since the last
+    collect with the totals deltas. Registering a known stream id again
+    replaces the worker's copy.
+    """
+    streams: Dict[str, DataStream] = {}
+    dirty: Dict[str, DataStream] = {}
+    flagged: Dict[str, List[Anomaly]] = {}
+    totals: Dict[str, List[int]] = {}
+    failures: List[Tuple[str, str]] = []
+    batches = 0
+    while True:
+        message = inbox.get()
+        if message is None:
+            return
+        op = message[0]
+        if op == "add":
+            stream = pickle.loads(message[1])
+            _clear_shipped(stream)
+            streams[stream.stream_id] = stream
+        elif op == "batches":
+            for stream_id, data, criteria in message[1]:
+                try:
+                    stream = streams[stream_id]
+                    errors = stream.errors
+                    anomalies = stream.score(data)
+                    if anomalies:
+                        flagged.setdefault(stream_id, []).extend(anomalies)
+                    stream.process_batch(stream.filter_data(data, criteria),
+                                         False)
+                except Exception as exc:
+                    failures.append((stream_id, repr(exc)))
+                    continue
+                counters = totals.setdefault(stream.kind, [0, 0])
+                counters[0] += stream.ops
+                counters[1] += stream.errors - errors
+                dirty[stream_id] = stream
+                batches += 1
+        elif op == "collect":
+            deltas = [_stream_delta(stream, flagged.get(stream_id, []))
+                      for stream_id, stream in dirty.items()]
+            outbox.put((shard, deltas, totals, batches, failures))
+            dirty, flagged, totals, failures, batches = {}, {}, {}, [], 0
+
+
+class ShardedStreamProcess(StreamProcess):
+    """
+    Manager that spreads streams over worker processes. Each stream is
+    owned by the worker picked by hashing its stream_id, and its batches
+    are sent there, so ingestion of many streams scales with cores. The
+    per-stream stats and the totals are merged back on batch_result;
+    on_anomaly callbacks run in this process when the flags come back.
+    """
+
+    poll_interval: float = 1.0
+
+    def __init__(self, workers: Optional[int] = None, maxsize: int = 64,
+                 chunk: int = 64):
+        """
+        Start workers processes (one per core by default), each with an
+        inbox bounded to maxsize pending messages. Batches are sent to a
+        worker chunk at a time to keep the messaging overhead low.
+        """
+        super().__init__()
+        self.workers: int = workers or os.cpu_count() or 1
+        self.chunk: int = chunk
+        self._outbox: Any = multiprocessing.Queue()
+        self._inboxes: List[Any] = []
+        self._pending: List[List[Tuple[str, Any, Optional[str]]]] = [
+            [] for _ in range(self.workers)
+        ]
+        self._procs: List[Any] = []
+        for shard in range(self.workers):
+            inbox: Any = multiprocessing.Queue(maxsize)
+            proc = multiprocessing.Process(
+                target=_shard_worker, args=(shard, inbox, self._outbox),
+                daemon=True)
+            proc.start()
+            self._inboxes.append(inbox)
+            self._procs.append(proc)
+
+    def __enter__(self) -> "ShardedStreamProcess":
+        """Use the manager as a context that stops its workers on exit."""
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        """Stop the workers."""
+        self.close()
+
+    def shard_of(self, stream_id: str) -> int:
+        """Return the index of the worker that owns stream_id."""
+        return zlib.crc32(stream_id.encode()) % self.workers
+
+    def add_streams(self, stream: DataStream) -> None:
+        """
+        Register a stream and hand a copy of it to its owning worker. The
+        copy is sent without its on_anomaly callback, which stays here.
+        Raises ValueError if the stream cannot be pickled for the worker.
+        """
+        if self.streams.get(stream.stream_id) is stream:
+            return
+        payload = self._pack(stream)
+        super().add_streams(stream)
+        self._inboxes[self.shard_of(stream.stream_id)].put(("add", payload))
+
+    @staticmethod
+    def _pack(stream: DataStream) -> bytes:
+        """
+        Pickle a stream for its worker, leaving out the on_anomaly callback
+        and sealing its history so readings are never shipped back twice.
+        """
+        if isinstance(stream, SensorStream) and stream.history is not None:
+            stream.history.seal()
+        shipped = stream
+        if getattr(stream, "on_anomaly", None) is not None:
+            shipped = object.__new__(type(stream))
+            vars(shipped).update(vars(stream), on_anomaly=None)
+        try:
+            return pickle.dumps(shipped, pickle.HIGHEST_PROTOCOL)
+        except Exception as exc:
+            raise ValueError(f"Stream {stream.stream_id} cannot be sent to "
+                             f"a shard worker: {exc!r}") from exc
+
+    def ingest(self, stream: DataStream, data: Any,
+               criteria: Optional[str] = None, render: bool = True) -> str:
+        """
+        Queue one batch for the worker owning the stream. Processing
+        happens asynchronously, so no processing line is returned and
+        render is ignored; the results reach the local streams on the
+        next sync.
+        """
+        self.add_streams(stream)
+        shard = self.shard_of(stream.stream_id)
+        pending = self._pending[shard]
+        pending.append((stream.stream_id, data, criteria))
+        if len(pending) >= self.chunk:
+            self._flush(shard)
+        return ""
+
+    def _flush(self, shard: int) -> None:
+        """Send the batches queued for one worker."""
+        if self._pending[shard]:
+            self._inboxes[shard].put(("batches", self._pending[shard]))
+            self._pending[shard] = []
+
+    def sync(self) -> int:
+        """
+        Wait for every worker to drain its inbox, then fold the delta
+        reports of the streams they touched (counters, windows, new sketch
+        entries and history blocks) into the local streams, pass the
+        forwarded anomalies to on_anomaly and fold the totals in. Returns
+        the number of batches merged. Raises RuntimeError if a worker has
+        died instead of waiting for it forever.
+        """
+        for shard, inbox in enumerate(self._inboxes):
+            self._flush(shard)
+            inbox.put(("collect",))
+        merged = 0
+        failures: List[Tuple[str, str]] = []
+        pending = len(self._inboxes)
+        while pending:
+            try:
+                reply = self._outbox.get(timeout=self.poll_interval)
+            except Empty:
+                for shard, proc in enumerate(self._procs):
+                    if not proc.is_alive():
+                        raise RuntimeError(f"Shard worker {shard} exited "
+                                           f"with code {proc.exitcode}")
+                continue
+            pending -= 1
+            _, deltas, totals, batches, errors = reply
+            for delta in deltas:
+                _apply_delta(self.streams[delta[0]], delta)
+            for kind, (qty, errs) in totals.items():
+                self.totals[kind].qty += qty
+                self.totals[kind].errors += errs
+            merged += batches
+            failures.extend(errors)
+        self.batches += merged
+        if failures:
+            stream_id, error = failures[0]
+            raise RuntimeError(f"Stream {stream_id} failed: {error}")
+        return merged
+
+    def snapshot(self) -> bytes:
+        """Sync with the workers, then serialize as StreamProcess does."""
+        self.sync()
+        return super().snapshot()
+
+    def load_snapshot(self, data: bytes) -> int:
+        """
+        Restore a snapshot and hand the restored streams to their workers,
+        replacing the copies they held.
+        """
+        self.sync()
+        known = list(self.streams.values())
+        count = super().load_snapshot(data)
+        for stream in known:
+            self._inboxes[self.shard_of(stream.stream_id)].put(
+                ("add", self._pack(stream)))
+        return count
+
+    def batch_result(self) -> Generator[str, None, None]:
+        """Sync with the workers and yield the per-type results."""
+        self.sync()
+        yield from super().batch_result()
+
+    def close(self) -> None:
+        """Stop the workers once they have drained their inboxes."""
+        for shard, inbox in enumerate(self._inboxes):
+            self._flush(shard)
+            inbox.put(None)
+        for proc in self._procs:
+            proc.join()
+        self._inboxes = []
+        self._procs = []
 
 
 def main() -> None:
@@ -0,0 +1,234 @@
+"""
+Code Nexus - Stream Replay.
+Records the batches fed to a StreamProcess and replays them as load.
+
+Every ingested batch is stored as one JSON line with its offset from the
+start of the recording, so a capture keeps the real pacing of the traffic.
+A replay feeds the batches back into fresh DataStreams at the recorded
+speed, N times faster or as fast as possible, and reports the achieved
+throughput with ingest latency and scheduling lag percentiles:
+
+    python stream_replay.py record traffic.jsonl --streams 30 --batches 5000
+    python stream_replay.py replay traffic.jsonl --speed 1
+    python stream_replay.py replay traffic.jsonl --speed 10
+    python stream_replay.py replay traffic.jsonl --speed max
+"""
+
+import argparse
+import base64
+import json
+import random
+import time
+from typing import (IO, Any, Dict, Iterable, Iterator, List, NamedTuple,
+                    Optional)
+
+from data_stream import (SENSOR_FIELDS, STREAM_KINDS, DataStream,
+                         SensorBatch, SensorStream, StreamProcess)
+
+EVENTS = ["login", "logout", "error", "deploy", "alert", "sync"]
+
+
+class BatchRecord(NamedTuple):
+    """One recorded batch and when it was ingested."""
+
+    at: float
+    kind: str
+    stream_id: str
+    criteria: Optional[str]
+    batch: Any
+
+
+def _encode_batch(batch: Any) -> Any:
+    """Turn a batch into JSON-friendly data."""
+    if isinstance(batch, SensorBatch):
+        return {"columns": {name: batch.column(name).tolist()
+                            for name in SENSOR_FIELDS}}
+    if isinstance(batch, (bytes, bytearray, memoryview)):
+        return {"frames": base64.b64encode(bytes(batch)).decode()}
+    if hasattr(batch, "tolist"):
+        return batch.tolist()
+    return list(batch)
+
+
+def _decode_batch(data: Any) -> Any:
+    """Rebuild a batch written by _encode_batch."""
+    if isinstance(data, dict):
+        if "columns" in data:
+            return SensorBatch(*(data["columns"][name]
+                                 for name in SENSOR_FIELDS))
+        return base64.b64decode(data["frames"])
+    return [tuple(item) if isinstance(item, list) else item
+            for item in data]
+
+
+def _batch_items(stream: DataStream, batch: Any) -> int:
+    """Count the items of a batch; binary frames count per frame."""
+    if isinstance(stream, SensorStream) and isinstance(
+            batch, (bytes, bytearray, memoryview)):
+        return memoryview(batch).nbytes // stream.frame_layout.struct.size
+    return len(batch)
+
+
+def write_record(file: IO[str], record: BatchRecord) -> None:
+    """Append one record to a recording as a JSON line."""
+    file.write(json.dumps([record.at, record.kind, record.stream_id,
+                           record.criteria, _encode_batch(record.batch)]))
+    file.write("\n")
+
+
+def read_records(file: IO[str]) -> Iterator[BatchRecord]:
+    """Lazily read the records of a recording."""
+    for line in file:
+        if line.strip():
+            at, kind, stream_id, criteria, batch = json.loads(line)
+            yield BatchRecord(at, kind, stream_id, criteria,
+                              _decode_batch(batch))
+
+
+class RecordingStreamProcess(StreamProcess):
+    """StreamProcess that also records every batch it ingests."""
+
+    def __init__(self, file: IO[str], **kwargs: Any) -> None:
+        """Record into file, an open text file, from now on."""
+        super().__init__(**kwargs)
+        self.file: IO[str] = file
+        self.started: float = time.perf_counter()
+
+    def ingest(self, stream: DataStream, data: Any,
+               criteria: Optional[str] = None, render: bool = True) -> str:
+        """Record the batch, then filter and process it as usual."""
+        write_record(self.file, BatchRecord(
+            time.perf_counter() - self.started, stream.kind,
+            stream.stream_id, criteria, data))
+        return super().ingest(stream, data, criteria, render)
+
+
+def generate(streams: int, batches: int, rate: float, size: int = 20,
+             seed: int = 42) -> Iterator[BatchRecord]:
+    """
+    Produce synthetic traffic: batches of size items spread round-robin
+    over streams of mixed types, arriving at rate batches per second.
+    """
+    rng = random.Random(seed)
+    kinds = list(STREAM_KINDS)
+    for i in range(batches):
+        index = i % streams
+        kind = kinds[index % len(kinds)]
+        batch: Any
+        if kind == "Sensor":
+            batch = [{"temp": round(rng.gauss(20, 6), 1),
+                      "humidity": round(rng.uniform(20, 90), 1),
+                      "pressure": round(rng.gauss(1013, 8), 1)}
+                     for _ in range(size)]
+        elif kind == "Transaction":
+            batch = [(f"ACC_{rng.randrange(100)}",
+                      round(rng.gauss(0, 80), 2)) for _ in range(size)]
+        else:
+            batch = rng.choices(EVENTS, k=size)
+        yield BatchRecord(i / rate, kind, f"{kind.upper()}_{index:03d}",
+                          "high", batch)
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Return the nearest-rank percentile of samples."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = -(-len(ordered) * pct // 100)
+    return ordered[max(0, int(rank) - 1)]
+
+
+def replay(records: Iterable[BatchRecord], speed: Optional[float] = 1.0,
+           process: Optional[StreamProcess] = None) -> Dict[str, float]:
+    """
+    Feed recorded batches into process (a new StreamProcess by default),
+    creating the streams on first sight. speed scales the recorded pacing;
+    None replays as fast as possible. Returns throughput, ingest latency
+    percentiles and how far dispatch fell behind the schedule.
+    """
+    process = process or StreamProcess()
+    streams: Dict[str, DataStream] = {}
+    latencies: List[float] = []
+    lags: List[float] = []
+    items = 0
+    start = time.perf_counter()
+    for record in records:
+        stream = streams.get(record.stream_id)
+        if stream is None:
+            stream = streams[record.stream_id] = \
+                STREAM_KINDS[record.kind](record.stream_id)
+        now = time.perf_counter()
+        if speed:
+            due = start + record.at / speed
+            if due > now:
+                time.sleep(due - now)
+                now = time.perf_counter()
+            lags.append(now - due)
+        process.ingest(stream, record.batch, record.criteria, False)
+        latencies.append(time.perf_counter() - now)
+        items += _batch_items(stream, record.batch)
+    elapsed = time.perf_counter() - start
+    return {
+        "batches": len(latencies),
+        "items": items,
+        "streams": len(streams),
+        "seconds": elapsed,
+        "batches_per_sec": len(latencies) / elapsed if elapsed else 0.0,
+        "items_per_sec": items / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "lag_p99_ms": percentile(lags, 99) * 1000
+    }
+
+
+def main() -> None:
+    """Record synthetic traffic or replay a recording from the CLI."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[2])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record = commands.add_parser("record", help="write synthetic traffic")
+    record.add_argument("path")
+    record.add_argument("--streams", type=int, default=30)
+    record.add_argument("--batches", type=int, default=5000)
+    record.add_argument("--rate", type=float, default=1000,
+                        help="batches per second (default 1000)")
+    record.add_argument("--size", type=int, default=20,
+                        help="items per batch (default 20)")
+    record.add_argument("--seed", type=int, default=42)
+
+    play = commands.add_parser("replay", help="replay a recording")
+    play.add_argument("path")
+    play.add_argument("--speed", default="1",
+                      help="pacing multiplier, or max (default 1)")
+    play.add_argument("--output", help="also write the report as JSON")
+    args = parser.parse_args()
+
+    if args.command == "record":
+        with open(args.path, "w", encoding="utf-8") as file:
+            for item in generate(args.streams, args.batches, args.rate,
+                                 args.size, args.seed):
+                write_record(file, item)
+        print(f"Recorded {args.batches} batches to {args.path}")
+        return
+
+    speed = None if args.speed == "max" else float(args.speed)
+    with open(args.path, encoding="utf-8") as file:
+        report = replay(read_records(file), speed)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+    print("=== CODE NEXUS - STREAM REPLAY ===")
+    template = "Replayed {batches} batches ({items} items) over {streams} " \
+        "streams in {seconds:.2f}s"
+    print(template.format(**report))
+    template = "Throughput: {batches_per_sec:,.0f} batches/s, " \
+        "{items_per_sec:,.0f} items/s"
+    print(template.format(**report))
+    template = "Ingest latency: p50 {p50_ms:.3f} ms, p95 {p95_ms:.3f} ms, " \
+        "p99 {p99_ms:.3f} ms; schedule lag p99 {lag_p99_ms:.3f} ms"
+    print(template.format(**report))
+
+
+if __name__ == "__main__":
+    main()